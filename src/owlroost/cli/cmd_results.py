@@ -1,20 +1,59 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import math
 import os
+import re
+import shutil
 import subprocess
 import sys
 import tomllib
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal
 
 import click
-import tomlkit
-import yaml
-from loguru import logger
 
-from owlroost.cli.utils import format_optimization_summary, format_rates_summary
+from owlroost.cli.utils import CACHE_DIR, format_optimization_summary, format_rates_summary
+
+# orjson is an optional speedup for metrics files; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_nonfinite(obj) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+def loads_json(data: bytes):
+    """Parse JSON, accepting the NaN/Infinity that stdlib json writes and orjson rejects."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json_pretty(data) -> str:
+    """Return data as JSON indented by 2; NaN/inf stay NaN/Infinity, as stdlib json writes."""
+    if orjson is None or _has_nonfinite(data):
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
 
 # ---------------------------------------------------------------------
 # Configuration
@@ -23,6 +62,15 @@ from owlroost.cli.utils import format_optimization_summary, format_rates_summary
 RESULTS_DIR = Path("results")
 IGNORE_PREFIXES = ("Hydra", "hydra")
 
+# Discovery is dominated by filesystem latency; overlap it across cases.
+# Set OWL_DISCOVERY_THREADS=1 to scan serially (e.g. fast local disks).
+DISCOVERY_THREADS = int(os.getenv("OWL_DISCOVERY_THREADS", "8"))
+
+# Derived data about results trees (discovery, parsed files), kept in the
+# per-user cache so the results tree itself is never written to
+RESULTS_CACHE_DIR = CACHE_DIR / "results"
+DISCOVERY_CACHE_VERSION = 3
+
 W_ID = 3
 W_EXP = 4
 W_RUN = 7
@@ -34,6 +82,12 @@ W_YEAR = 9
 W_NET = 9
 W_BEQ = 9
 
+# Hydra escapes spaces as '\ '; trial.count is bookkeeping, not a scenario override
+ESCAPED_SPACE = re.compile(r"\\ ")
+COUNT_OVERRIDE = re.compile(r"count(?:=|$)")
+
+BY_NAME = attrgetter("name")
+
 # ---------------------------------------------------------------------
 # Data models
 # ---------------------------------------------------------------------
@@ -52,6 +106,10 @@ class Run:
     overrides: list[str]
     trials: list[Trial]
 
+    @cached_property
+    def display_overrides(self) -> str:
+        return normalize_overrides_for_display(self.overrides)
+
 
 @dataclass
 class Experiment:
@@ -66,6 +124,33 @@ class Case:
     experiments: list[Experiment]
 
 
+@dataclass
+class RenderContext:
+    """
+    Rendering inputs for a selected case.
+    The case TOML and per-trial metrics are loaded on first use and reused
+    by every table rendered for the same invocation.
+    """
+
+    case: Case
+    value_mode: str
+    metrics: dict[Path, dict | None] = field(default_factory=dict)
+
+    @cached_property
+    def case_toml(self) -> dict:
+        return load_case_original_toml(self.case) or {}
+
+    def preload_metrics(self, trials: Iterable[Trial]):
+        """Load metrics for all not-yet-loaded trials concurrently."""
+        paths = [t.path for t in trials if t.path not in self.metrics]
+        self.metrics.update(zip(paths, map_threaded(load_metrics, paths), strict=True))
+
+    def trial_metrics(self, trial: Trial) -> dict | None:
+        if trial.path not in self.metrics:
+            self.metrics[trial.path] = load_metrics(trial.path)
+        return self.metrics[trial.path]
+
+
 @dataclass(frozen=True)
 class FileDescriptor:
     suffix: str
@@ -96,6 +181,32 @@ def relpath(p: Path) -> Path:
         return p
 
 
+FILE_SUFFIXES = tuple(d.suffix for d in FILE_DESCRIPTORS)
+
+
+@cache
+def trial_files(trial_dir: Path) -> dict[str, Path]:
+    """
+    Map each known FILE_DESCRIPTORS suffix to the matching file in trial_dir.
+
+    One scandir pass per directory replaces a glob per suffix lookup.
+    Missing directories yield an empty mapping.
+    """
+    files: dict[str, Path] = {}
+    try:
+        with os.scandir(trial_dir) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                for suffix in FILE_SUFFIXES:
+                    if e.name.endswith(suffix):
+                        files.setdefault(suffix, Path(e.path))
+                        break
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return files
+
+
 def describe_file(name: str) -> tuple[str | None, str | None]:
     for d in FILE_DESCRIPTORS:
         if name.endswith(d.suffix):
@@ -209,15 +320,15 @@ def cmd_results(
         click.echo(f"Results directory not found: {RESULTS_DIR}")
         return
 
-    cases = discover_cases(RESULTS_DIR)
-    if not cases:
-        click.echo("No results found.")
-        return
-
     # -------------------------------------------------
     # CASE SUMMARY (no case selected)
     # -------------------------------------------------
     if case is None:
+        cases = discover_cases_cached(RESULTS_DIR)
+        if not cases:
+            click.echo("No results found.")
+            return
+
         if delete:
             delete_ids = parse_id_list(delete)
             bad = [i for i in delete_ids if i < 0 or i >= len(cases)]
@@ -227,16 +338,22 @@ def cmd_results(
             click.echo("Deleting cases:")
             for i in delete_ids:
                 click.echo(f"  [{i}] {cases[i].path}")
-                import shutil
-
                 shutil.rmtree(cases[i].path, ignore_errors=True)
             return
 
         render_case_summary(cases)
         return
 
-    selected = resolve_case(case, cases)
+    # A selected case only needs its own subtree walked
+    names = discover_case_names(RESULTS_DIR)
+    if not names:
+        click.echo("No results found.")
+        return
+
+    selected = discover_one_case(RESULTS_DIR / resolve_case(case, names))
     runs = flatten_runs(selected)
+    run_to_exp = {id(r): i for i, e in enumerate(selected.experiments) for r in e.runs}
+    ctx = RenderContext(selected, value_mode)
 
     # -------------------------------------------------
     # RUN SUMMARY (case selected, no run_id)
@@ -251,13 +368,11 @@ def cmd_results(
             click.echo("Deleting runs:")
             for i in delete_ids:
                 click.echo(f"  [{i}] {runs[i].path}")
-                import shutil
-
                 shutil.rmtree(runs[i].path, ignore_errors=True)
             return
 
-        render_case_summary([selected])
-        render_run_summary(selected, value_mode)
+        render_case_summary([selected], [ctx.case_toml])
+        render_run_summary(ctx)
         return
 
     # -------------------------------------------------
@@ -277,10 +392,10 @@ def cmd_results(
     # -------------------------------------------------
     if trial_id is None:
         if len(trials) > 1:
-            exp_id = next(i for i, e in enumerate(selected.experiments) if run in e.runs)
-            render_case_summary([selected])
-            render_run_summary(selected, value_mode, selected_run=run)
-            render_run_trials(selected, run, exp_id, value_mode)
+            exp_id = run_to_exp[id(run)]
+            render_case_summary([selected], [ctx.case_toml])
+            render_run_summary(ctx, selected_run=run)
+            render_run_trials(ctx, run, exp_id)
             return
         else:
             trial_id = 0
@@ -310,29 +425,24 @@ def cmd_results(
 
     # Context headers (lightweight, consistent)
 
-    exp_id = next(i for i, e in enumerate(selected.experiments) if run in e.runs)
-    trial_id = run.trials.index(trial)
+    exp_id = run_to_exp[id(run)]
 
-    render_case_summary([selected])
+    render_case_summary([selected], [ctx.case_toml])
 
-    render_run_summary(selected, value_mode, selected_run=run)
+    render_run_summary(ctx, selected_run=run)
 
     if len(trials) > 1:
-        render_run_trials(selected, run, exp_id, value_mode, selected_trial=trial)
-
-    # render_single_trial_summary(selected,run,trial,exp_id,trial_id,value_mode )
+        render_run_trials(ctx, run, exp_id, selected_trial=trial)
 
-    # Leaf default behavior
-    if summary:
-        render_summary(trial.path)
-    if original:
-        render_original_toml(trial.path)
-    if effective:
-        render_effective_toml(trial.path)
+    # Leaf default behavior; all lookups share one scan of the trial directory
+    requested = {"summary": summary, "original": original, "effective": effective}
+    for kind in TRIAL_TEXT_FILES:
+        if requested[kind]:
+            render_trial_file(trial.path, kind)
     if files:
         render_files(trial.path)
     if metrics:
-        render_metrics(trial.path)
+        render_metrics(ctx.trial_metrics(trial))
 
 
 # ---------------------------------------------------------------------
@@ -340,37 +450,199 @@ def cmd_results(
 # ---------------------------------------------------------------------
 
 
-def discover_cases(results_dir: Path) -> list[Case]:
-    return [
-        Case(d.name, d, discover_experiments(d))
-        for d in sorted(results_dir.iterdir())
-        if d.is_dir()
-    ]
+def map_threaded(fn: Callable, items: Iterable) -> list:
+    """
+    Map fn over items using a small thread pool for I/O-bound work.
+    Falls back to a serial map when threading is disabled or pointless.
+    """
+    items = list(items)
+    workers = min(DISCOVERY_THREADS, len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items))
+
+
+def scan_subdirs(path: Path | str, prefix: str = "") -> list[os.DirEntry]:
+    """
+    Return subdirectory entries of path whose names start with prefix, sorted by name.
+
+    Uses os.scandir so the directory check comes from the readdir entry type
+    instead of a separate stat() per child.
+    """
+    with os.scandir(path) as it:
+        entries = [e for e in it if e.name.startswith(prefix) and e.is_dir()]
+    entries.sort(key=BY_NAME)
+    return entries
+
+
+def discover_cases(results_dir: Path, watch: dict[str, int] | None = None) -> list[Case]:
+    case_dirs = [results_dir / name for name in discover_case_names(results_dir, watch)]
+    return map_threaded(lambda case_dir: discover_one_case(case_dir, watch), case_dirs)
+
+
+def discover_case_names(results_dir: Path, watch: dict[str, int] | None = None) -> list[str]:
+    """Return the case directory names under results_dir, sorted, without recursing."""
+    _watch(watch, results_dir)
+    return [e.name for e in scan_subdirs(results_dir)]
+
+
+def discover_one_case(case_dir: Path, watch: dict[str, int] | None = None) -> Case:
+    return Case(case_dir.name, case_dir, discover_experiments(case_dir, watch))
+
+
+def _watch(watch: dict[str, int] | None, path: Path | str) -> None:
+    # Stat before the path is read, so a change made during discovery leaves
+    # an older mtime behind and invalidates the cache on the next call.
+    if watch is not None:
+        watch[str(path)] = _mtime_ns(path)
 
 
-def discover_experiments(case_dir: Path) -> list[Experiment]:
+def discover_cases_cached(results_dir: Path) -> list[Case]:
+    """
+    discover_cases() backed by a JSON cache under RESULTS_CACHE_DIR.
+
+    The cache stores the mtime of every directory discovery listed (results
+    root, case, date, time, run and trials directories, empty ones included)
+    and of the hydra_meta.yaml / multirun.yaml files it read. Adding, removing
+    or editing any of them invalidates it, so validating costs one stat() per
+    entry instead of a full walk with metadata reads. Any unreadable or stale
+    cache is rebuilt, and each rebuild prunes the cache directory.
+    """
+    cache_path = results_cache_file(results_dir, "discovery")
+
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["version"] == DISCOVERY_CACHE_VERSION and all(
+            _mtime_ns(p) == m for p, m in cached["mtimes"].items()
+        ):
+            return [case_from_json(c) for c in cached["cases"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    watch: dict[str, int] = {}
+    cases = discover_cases(results_dir, watch)
+    payload = {
+        "version": DISCOVERY_CACHE_VERSION,
+        "source": os.path.abspath(results_dir),
+        "mtimes": watch,
+        "cases": [case_to_json(c) for c in cases],
+    }
+
+    tmp = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+    prune_results_cache()
+    return cases
+
+
+def prune_results_cache() -> None:
+    """
+    Delete cache files under RESULTS_CACHE_DIR whose source path is gone.
+
+    Run on discovery rebuilds, i.e. after the results tree changed, so
+    copies for deleted results directories and files do not pile up.
+    """
+    try:
+        files = list(RESULTS_CACHE_DIR.glob("*.json"))
+    except OSError:
+        return
+    for f in files:
+        try:
+            source = json.loads(f.read_bytes())["source"]
+        except (OSError, ValueError, KeyError, TypeError):
+            source = None
+        if not isinstance(source, str) or not os.path.exists(source):
+            try:
+                f.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def case_to_json(case: Case) -> dict:
+    return {
+        "name": case.name,
+        "path": str(case.path),
+        "experiments": [
+            {
+                "type": exp.type,
+                "runs": [
+                    {
+                        "path": str(run.path),
+                        "name": run.name,
+                        "overrides": run.overrides,
+                        "trials": [[str(t.path), t.name] for t in run.trials],
+                    }
+                    for run in exp.runs
+                ],
+            }
+            for exp in case.experiments
+        ],
+    }
+
+
+def case_from_json(data: dict) -> Case:
+    return Case(
+        data["name"],
+        Path(data["path"]),
+        [
+            Experiment(
+                exp["type"],
+                [
+                    Run(
+                        Path(run["path"]),
+                        run["name"],
+                        run["overrides"],
+                        [Trial(Path(p), name) for p, name in run["trials"]],
+                    )
+                    for run in exp["runs"]
+                ],
+            )
+            for exp in data["experiments"]
+        ],
+    )
+
+
+def _mtime_ns(path: Path | str) -> int:
+    # -1 marks a missing path, so its later creation invalidates the cache
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def discover_experiments(case_dir: Path, watch: dict[str, int] | None = None) -> list[Experiment]:
     experiments: list[Experiment] = []
 
-    for date_dir in sorted(p for p in case_dir.iterdir() if p.is_dir()):
-        for time_dir in sorted(p for p in date_dir.iterdir() if p.is_dir()):
+    _watch(watch, case_dir)
+    for date_entry in scan_subdirs(case_dir):
+        _watch(watch, date_entry.path)
+        for time_entry in scan_subdirs(date_entry.path):
             runs: list[Run] = []
 
-            for run_dir in sorted(
-                p for p in time_dir.iterdir() if p.is_dir() and p.name.startswith("run_")
-            ):
-                overrides = extract_run_overrides(run_dir / "hydra_meta.yaml")
-                trials_dir = run_dir / "trials"
-                trials = (
-                    [Trial(p, p.name) for p in sorted(trials_dir.iterdir())]
-                    if trials_dir.exists()
-                    else [Trial(run_dir, run_dir.name)]
-                )
-                runs.append(Run(run_dir, run_dir.name, overrides, trials))
+            _watch(watch, time_entry.path)
+            for run_entry in scan_subdirs(time_entry.path, prefix="run_"):
+                run_dir = Path(run_entry.path)
+                meta_path = run_dir / "hydra_meta.yaml"
+                _watch(watch, run_dir)
+                _watch(watch, meta_path)
+                _watch(watch, run_dir / "trials")
+                overrides = extract_run_overrides(meta_path)
+                trials = discover_trials(run_dir)
+                runs.append(Run(run_dir, run_entry.name, overrides, trials))
 
             if runs:
+                multirun_yaml = Path(time_entry.path) / "multirun.yaml"
+                _watch(watch, multirun_yaml)
                 experiments.append(
                     Experiment(
-                        "multi" if (time_dir / "multirun.yaml").exists() else "single",
+                        "multi" if multirun_yaml.exists() else "single",
                         runs,
                     )
                 )
@@ -378,27 +650,99 @@ def discover_experiments(case_dir: Path) -> list[Experiment]:
     return experiments
 
 
+def discover_trials(run_dir: Path) -> list[Trial]:
+    """
+    Return the trials of a run, sorted by name.
+
+    A run without a trials/ directory is its own single trial. The scandir
+    call doubles as the existence check, so no separate stat() is needed.
+    """
+    try:
+        with os.scandir(run_dir / "trials") as it:
+            entries = list(it)
+        entries.sort(key=BY_NAME)
+    except FileNotFoundError:
+        return [Trial(run_dir, run_dir.name)]
+
+    return [Trial(Path(e.path), e.name) for e in entries]
+
+
 # ---------------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------------
 
 
 def parse_id_list(s: str) -> list[int]:
-    ids: set[int] = set()
+    """
+    Parse "1,3-5" style ID lists.
+    Duplicates are dropped; IDs keep the order in which they were given.
+    """
+    ids: dict[int, None] = {}
     for part in s.split(","):
         part = part.strip()
         if "-" in part:
             a, b = map(int, part.split("-", 1))
-            ids.update(range(a, b + 1))
+            ids.update(dict.fromkeys(range(a, b + 1)))
         else:
-            ids.add(int(part))
-    return sorted(ids)
+            ids[int(part)] = None
+    return list(ids)
+
+
+def load_hydra_meta(meta_path: Path) -> dict:
+    """
+    Load a run's hydra_meta.yaml, reusing a cached JSON copy of the parse.
+    """
+
+    # PyYAML is only needed when the cached copy is stale; import it on demand
+    def parse(path: Path) -> dict:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(path.read_text(), Loader=loader) or {}
+
+    try:
+        return load_with_sidecar(meta_path, parse)
+    except FileNotFoundError:
+        return {}
+
+
+def results_cache_file(path: Path, kind: str) -> Path:
+    """Return the per-user cache file of the given kind for a results path."""
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return RESULTS_CACHE_DIR / f"{key}.{kind}.json"
+
+
+def load_with_sidecar(source: Path, parse: Callable[[Path], dict]) -> dict:
+    """
+    Return parse(source), reusing a JSON copy of the result.
+
+    The copy lives under RESULTS_CACHE_DIR, keyed by the source's absolute
+    path, and records the source's mtime and size; it is used only while both
+    still match. Data with no JSON form (e.g. TOML dates) or an unwritable
+    cache simply skip the copy.
+    """
+    st = source.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    sidecar = results_cache_file(source, "parsed")
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached["source"] == os.path.abspath(source) and cached["stamp"] == stamp:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = parse(source)
+    try:
+        payload = {"source": os.path.abspath(source), "stamp": stamp, "data": data}
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        sidecar.write_text(json.dumps(payload))
+    except (OSError, TypeError):
+        pass
+    return data
 
 
 def extract_run_overrides(meta_path: Path) -> list[str]:
-    if not meta_path.exists():
-        return []
-    data = yaml.safe_load(meta_path.read_text()) or {}
+    data = load_hydra_meta(meta_path)
     return [
         strip_override_prefix(o)
         for o in data.get("overrides", [])
@@ -415,38 +759,43 @@ def flatten_trials_for_run(run: Run) -> list[Trial]:
 
 
 def load_metrics(run_dir: Path) -> dict | None:
-    p = next(run_dir.glob("*_metrics.json"), None)
-    return json.load(p.open()) if p else None
+    p = trial_files(run_dir).get("_metrics.json")
+    return loads_json(p.read_bytes()) if p else None
+
+
+# Original TOML is identical for every trial of a case; keyed by case directory
+_CASE_TOML_CACHE: dict[Path, dict | None] = {}
 
 
 def load_case_original_toml(case: Case) -> dict | None:
-    for exp in case.experiments:
-        for run in exp.runs:
-            for t in run.trials:
-                p = next(t.path.glob("*_original.toml"), None)
-                if p:
-                    return tomllib.load(p.open("rb"))
-    return None
+    """
+    Return the original TOML of a case, read from its first trial that has one.
+    Results are memoized per case directory for the life of the process.
+    """
+    if case.path not in _CASE_TOML_CACHE:
+        _CASE_TOML_CACHE[case.path] = _find_case_original_toml(case)
+    return _CASE_TOML_CACHE[case.path]
+
+
+def _find_case_original_toml(case: Case) -> dict | None:
+    # Every trial writes *_original.toml before solving, so the first trial
+    # normally has it; later trials are only scanned if it is missing.
+    trials = (t for run in flatten_runs(case) for t in run.trials)
+    p = next((p for t in trials if (p := trial_files(t.path).get("_original.toml"))), None)
+    if p is None:
+        return None
+    return load_with_sidecar(p, lambda path: tomllib.loads(path.read_text(encoding="utf-8")))
 
 
 def normalize_overrides_for_display(overrides) -> str:
     if not overrides:
         return "—"
 
-    cleaned = []
-    for o in overrides:
-        if not isinstance(o, str):
-            continue
-
-        # Remove Hydra escaping for spaces
-        o = o.replace("\\ ", " ")
-
-        # Drop overrides with key == "count"
-        key = o.split("=", 1)[0]
-        if key == "count":
-            continue
-
-        cleaned.append(o)
+    cleaned = [
+        ESCAPED_SPACE.sub(" ", o)
+        for o in overrides
+        if isinstance(o, str) and not COUNT_OVERRIDE.match(o)
+    ]
 
     return ", ".join(cleaned) if cleaned else "—"
 
@@ -456,24 +805,29 @@ def normalize_overrides_for_display(overrides) -> str:
 # ---------------------------------------------------------------------
 
 
-def render_divider():
-    click.echo("-" * 100)
+DIVIDER = "-" * 100
 
 
-def render_case_summary(cases: list[Case]):
-    click.echo("CASE SUMMARY")
-    render_divider()
-    click.echo(
+def render_case_summary(cases: list[Case], origs: list[dict | None] | None = None):
+    """
+    Render one summary row per case.
+    If origs is provided, it holds each case's already-loaded original TOML.
+    """
+    lines = ["CASE SUMMARY", DIVIDER]
+    lines.append(
         f"{'ID':>{W_ID}} {'Exps':>{W_EXP}} "
         f"{'Runs':<{W_RUN}} {'Trials':>{W_TRIAL}}  "
         f"{'Case Name':<{W_CASE}} "
         f"{'Optimization':<{W_OPT}} {'Rates':<{W_RATES}}"
     )
-    render_divider()
+    lines.append(DIVIDER)
+
+    if origs is None:
+        origs = map_threaded(load_case_original_toml, cases)
 
-    for i, case in enumerate(cases):
-        orig = load_case_original_toml(case) or {}
-        click.echo(
+    for i, (case, orig) in enumerate(zip(cases, origs, strict=True)):
+        orig = orig or {}
+        lines.append(
             f"{i:>{W_ID}} "
             f"{len(case.experiments):>{W_EXP}} "
             f"{sum(len(e.runs) for e in case.experiments):<{W_RUN}} "
@@ -483,14 +837,15 @@ def render_case_summary(cases: list[Case]):
             f"{format_rates_summary(orig):<{W_RATES}}"
         )
 
+    click.echo("\n".join(lines))
+
 
 def render_run_summary(
-    case: Case,
-    value_mode: str,
+    ctx: RenderContext,
     selected_run: Run | None = None,
 ):
     """
-    Render a summary of runs for a selected case.
+    Render a summary of runs for the case selected in ctx.
     If selected_run is provided, show only that run.
     Averages numeric metrics across all trials in each run.
 
@@ -507,10 +862,8 @@ def render_run_summary(
     # -------------------------
     # Header
     # -------------------------
-    click.echo("")
-    click.echo("RUN SUMMARY")
-    render_divider()
-    click.echo(
+    lines = ["", "RUN SUMMARY", DIVIDER]
+    lines.append(
         f"{'':>{W_ID}} "
         f"{'':>{W_EXP}} "
         f"{'':<{W_RUN}} "
@@ -520,20 +873,32 @@ def render_run_summary(
         f"{'Bequest':>{W_BEQ}} "
         f""
     )
+    case = ctx.case
+    value_mode = ctx.value_mode
     value_display = f"({value_mode} $K)"
-    click.echo(
+    lines.append(
         f"{'ID':>{W_ID}} {'Exp':>{W_EXP}} {'Run':<{W_RUN}} {'Trials':>{W_TRIAL}} "
         f"{value_display:>{W_YEAR}} {value_display:>{W_NET}} {value_display:>{W_BEQ}}   Overrides"
     )
-    render_divider()
+    lines.append(DIVIDER)
 
     # -------------------------
     # Collect rows (no output)
     # -------------------------
     rows = []
     run_id = 0
-    case_toml = load_case_original_toml(case)
-    case_objective = case_toml.get("optimization_parameters", {}).get("objective", "maxBequest")
+    case_objective = ctx.case_toml.get("optimization_parameters", {}).get("objective", "maxBequest")
+
+    net_key = f"total_net_spending_{value_mode}"
+    beq_key = f"total_final_bequest_{value_mode}"
+
+    ctx.preload_metrics(
+        t
+        for exp in case.experiments
+        for run in exp.runs
+        if selected_run is None or run is selected_run
+        for t in run.trials
+    )
 
     for exp_id, exp in enumerate(case.experiments):
         for run in exp.runs:
@@ -546,15 +911,15 @@ def render_run_summary(
             beq_vals = []
 
             for t in run.trials:
-                m = load_metrics(t.path) or {}
+                m = ctx.trial_metrics(t) or {}
 
                 if (v := m.get("net_spending_for_plan_year_0")) is not None:
                     yearly_vals.append(v)
 
-                if (v := m.get(f"total_net_spending_{value_mode}")) is not None:
+                if (v := m.get(net_key)) is not None:
                     net_vals.append(v)
 
-                if (v := m.get(f"total_final_bequest_{value_mode}")) is not None:
+                if (v := m.get(beq_key)) is not None:
                     beq_vals.append(v)
 
             def avg(vals):
@@ -583,7 +948,7 @@ def render_run_summary(
                     "net": net_avg,
                     "beq": beq_avg,
                     "objective": effective_objective,
-                    "overrides": normalize_overrides_for_display(run.overrides),
+                    "overrides": run.display_overrides,
                 }
             )
 
@@ -608,7 +973,7 @@ def render_run_summary(
     # Render rows
     # -------------------------
     for row in rows:
-        click.echo(
+        lines.append(
             f"{row['run_id']:>{W_ID}} "
             f"{row['exp_id']:>{W_EXP}} "
             f"{row['run'].name:<{W_RUN}} "
@@ -619,19 +984,17 @@ def render_run_summary(
             f"{row['overrides']}"
         )
 
+    click.echo("\n".join(lines))
+
 
 def render_run_trials(
-    case: Case,
+    ctx: RenderContext,
     run: Run,
     exp_id: int,
-    value_mode: str,
     selected_trial: Trial | None = None,
 ):
-    click.echo("")
-    click.echo("TRIAL SUMMARY")
-
-    render_divider()
-    click.echo(
+    lines = ["", "TRIAL SUMMARY", DIVIDER]
+    lines.append(
         f"{'':>{W_ID}} "
         f"{'':>{W_EXP}} "
         f"{'':<{W_RUN}} "
@@ -641,66 +1004,76 @@ def render_run_trials(
         f"{'Bequest':>{W_BEQ}} "
         f""
     )
+    value_mode = ctx.value_mode
     value_display = f"({value_mode} $K)"
-    click.echo(
+    lines.append(
         f"{'ID':>{W_ID}} {'Exp':>{W_EXP}} {'Run':<{W_RUN}} {'Trials':>{W_TRIAL}} "
         f"{value_display:>{W_YEAR}} {value_display:>{W_NET}} {value_display:>{W_BEQ}}   Overrides"
     )
-    render_divider()
+    lines.append(DIVIDER)
+
+    net_key = f"total_net_spending_{value_mode}"
+    beq_key = f"total_final_bequest_{value_mode}"
+    overrides = run.display_overrides
 
     for i, t in enumerate(run.trials):
         # 🔹 Filter if a specific trial is selected
         if selected_trial is not None and t is not selected_trial:
             continue
 
-        m = load_metrics(t.path) or {}
+        m = ctx.trial_metrics(t) or {}
 
-        click.echo(
+        lines.append(
             f"{i:>{W_ID}} {exp_id:>{W_EXP}} {run.name:<{W_RUN}} {t.name:>{W_TRIAL}} "
             f"{format_k(m.get('net_spending_for_plan_year_0')):>{W_YEAR}} "
-            f"{format_k(m.get(f'total_net_spending_{value_mode}')):>{W_NET}} "
-            f"{format_k(m.get(f'total_final_bequest_{value_mode}')):>{W_BEQ}}   "
-            f"{normalize_overrides_for_display(run.overrides)}"
+            f"{format_k(m.get(net_key)):>{W_NET}} "
+            f"{format_k(m.get(beq_key)):>{W_BEQ}}   "
+            f"{overrides}"
         )
 
+    click.echo("\n".join(lines))
 
-def render_metrics(run_dir: Path):
-    data = load_metrics(run_dir)
-    click.echo(json.dumps(data, indent=2) if data else "(no metrics found)")
 
+def render_metrics(data: dict | None):
+    click.echo(dumps_json_pretty(data) if data else "(no metrics found)")
 
-def render_summary(run_dir: Path):
-    p = next(run_dir.glob("*_summary.json"), None)
-    click.echo(p.read_text() if p else "(no summary found)")
 
+# Trial files that --summary/--original/--effective echo verbatim: (suffix, label)
+TRIAL_TEXT_FILES = {
+    "summary": ("_summary.json", "summary"),
+    "original": ("_original.toml", "original TOML"),
+    "effective": ("_effective.toml", "effective TOML"),
+}
 
-def render_original_toml(run_dir: Path):
-    p = next(run_dir.glob("*_original.toml"), None)
-    click.echo(p.read_text() if p else "(no original TOML found)")
 
+def render_trial_file(run_dir: Path, kind: str):
+    suffix, label = TRIAL_TEXT_FILES[kind]
+    p = trial_files(run_dir).get(suffix)
+    click.echo(p.read_text() if p else f"(no {label} found)")
 
-def render_effective_toml(run_dir: Path):
-    p = next(run_dir.glob("*_effective.toml"), None)
-    click.echo(p.read_text() if p else "(no effective TOML found)")
 
-
-def resolve_case(token: str, cases: list[Case]) -> Case:
+def resolve_case(token: str, names: list[str]) -> str:
+    """Resolve a case ID (index into the sorted names) or name to a case name."""
     if token.isdigit():
-        return cases[int(token)]
-    for c in cases:
-        if c.name == token:
-            return c
+        if int(token) >= len(names):
+            raise click.ClickException(f"Invalid case ID: {token}")
+        return names[int(token)]
+    if token in names:
+        return token
     raise click.ClickException(f"Case not found: {token}")
 
 
 def render_files(run_dir: Path):
     """List files in a trial directory."""
-    if not run_dir.exists():
+    try:
+        with os.scandir(run_dir) as it:
+            # dot-files are cache sidecars left by older versions, not outputs
+            names = [e.name for e in it if e.is_file() and not e.name.startswith(".")]
+    except FileNotFoundError:
         click.echo("(trial directory not found)")
         return
 
-    files = sorted(p for p in run_dir.iterdir() if p.is_file())
-    if not files:
+    if not names:
         click.echo("(no files found)")
         return
 
@@ -708,15 +1081,15 @@ def render_files(run_dir: Path):
     outputs: list[tuple[str, str]] = []
     others: list[str] = []
 
-    for p in files:
-        kind, desc = describe_file(p.name)
+    for name in names:
+        kind, desc = describe_file(name)
 
         if kind == "INPUT":
-            inputs.append((p.name, desc))
+            inputs.append((name, desc))
         elif kind == "OUTPUT":
-            outputs.append((p.name, desc))
+            outputs.append((name, desc))
         else:
-            others.append(p.name)
+            others.append(name)
 
     # Sort alphabetically within groups
     inputs.sort()
@@ -727,30 +1100,28 @@ def render_files(run_dir: Path):
     # Display
     # -------------------------
 
-    click.echo("")
-    click.echo("FILES")
-    render_divider()
-    click.echo(f"Path: {run_dir}")
-    render_divider()
+    lines = ["", "FILES", DIVIDER, f"Path: {run_dir}", DIVIDER]
     if inputs:
-        click.echo("INPUT FILES:")
+        lines.append("INPUT FILES:")
         for name, desc in inputs:
-            click.echo(f"  {name:<35} [{desc}]")
+            lines.append(f"  {name:<35} [{desc}]")
 
     if outputs:
-        click.echo("\nOUTPUT FILES:")
+        lines.append("\nOUTPUT FILES:")
         for name, desc in outputs:
-            click.echo(f"  {name:<35} [{desc}]")
+            lines.append(f"  {name:<35} [{desc}]")
 
     if others:
-        click.echo("\nOTHER FILES:")
+        lines.append("\nOTHER FILES:")
         for name in others:
-            click.echo(f"  {name}")
+            lines.append(f"  {name}")
+
+    click.echo("\n".join(lines))
 
 
 def render_diff(trial_dir: Path):
-    orig = next(trial_dir.glob("*_original.toml"), None)
-    eff = next(trial_dir.glob("*_effective.toml"), None)
+    orig = trial_files(trial_dir).get("_original.toml")
+    eff = trial_files(trial_dir).get("_effective.toml")
 
     if not orig or not eff:
         click.echo("(original or effective TOML not found)")
@@ -761,52 +1132,9 @@ def render_diff(trial_dir: Path):
 
     diffs = diff_dicts(a, b)
 
-    click.echo("")
-    click.echo("DIFF (original → effective)")
-    render_divider()
-
-    if not diffs:
-        click.echo("No differences.")
-        return
-
-    for line in diffs:
-        click.echo(line)
-
-
-def render_single_trial_summary(
-    case: Case,
-    run: Run,
-    trial: Trial,
-    exp_id: int,
-    trial_id: int,
-    value_mode: str,
-):
-    """
-    Render a single trial summary and default to metrics output.
-    """
-
-    # -------------------------
-    # Context header
-    # -------------------------
-    if 0:
-        click.echo("RUN")
-        render_divider()
-        click.echo(f"EXP {exp_id} | {run.name} | {len(run.trials)} trials")
-
-        overrides = normalize_overrides_for_display(run.overrides)
-        click.echo(f"Overrides: {overrides}")
-        click.echo("")
-
-    logger.debug(f"{case} {run} {trial} {exp_id} {trial_id} {value_mode}")
-
-    # -------------------------
-    # Trial summary
-    # -------------------------
-    click.echo("")
-    click.echo("METRICS")
-    render_divider()
-
-    render_metrics(trial.path)
+    lines = ["", "DIFF (original → effective)", DIVIDER]
+    lines.extend(diffs or ["No differences."])
+    click.echo("\n".join(lines))
 
 
 def clone_effective_toml(trial_dir: Path, tag: str):
@@ -818,11 +1146,11 @@ def clone_effective_toml(trial_dir: Path, tag: str):
     # -------------------------
     # Locate source files
     # -------------------------
-    src_toml = next(trial_dir.glob("*_effective.toml"), None)
+    src_toml = trial_files(trial_dir).get("_effective.toml")
     if not src_toml:
         raise click.ClickException("No effective TOML found to clone")
 
-    src_xlsx = next(trial_dir.glob("*_effective.xlsx"), None)
+    src_xlsx = trial_files(trial_dir).get("_effective.xlsx")
     if not src_xlsx:
         raise click.ClickException("No effective XLSX found to clone")
 
@@ -853,6 +1181,8 @@ def clone_effective_toml(trial_dir: Path, tag: str):
     # -------------------------
     # Load + modify TOML
     # -------------------------
+    import tomlkit  # deferred: only --clone needs it
+
     doc = tomlkit.parse(src_toml.read_text(encoding="utf-8"))
 
     hfp = doc.get("household_financial_profile")
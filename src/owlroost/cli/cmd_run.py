@@ -1,5 +1,6 @@
 # src/owlroost/cli/cmd_run.py
 
+import logging
 import subprocess
 import sys
 import time
@@ -54,14 +55,17 @@ def format_elapsed(seconds: float) -> str:
     return f"{hours:d}:{minutes:02d}:{sec:02d}"
 
 
-def get_rate_selection_method(case_file: Path) -> str | None:
+def read_case_file(case_file: Path) -> dict:
+    """Parse a case file, reporting read and syntax errors as a ClickException."""
     try:
-        with case_file.open("rb") as f:
-            data = tomllib.load(f)
+        return tomllib.loads(case_file.read_text(encoding="utf-8"))
     except Exception as e:
         raise click.ClickException(f"Failed to read case file {case_file}: {e}") from None
 
-    return data.get("rates_selection", {}).get("method")
+
+def get_rate_selection_method(case_file: Path) -> str | None:
+    """Return rates_selection.method from a case file, validating the whole file."""
+    return read_case_file(case_file).get("rates_selection", {}).get("method")
 
 
 def validate_rate_method_for_trials(
@@ -104,7 +108,8 @@ def normalize_hydra_overrides(overrides: list[str]) -> list[str]:
     normalized = []
 
     for o in overrides:
-        if "=" not in o:
+        # Only a comma in the value can trigger a rewrite
+        if "," not in o or "=" not in o:
             normalized.append(o)
             continue
 
@@ -123,7 +128,7 @@ def normalize_hydra_overrides(overrides: list[str]) -> list[str]:
     return normalized
 
 
-def build_hydra_command(
+def build_hydra_args(
     case_file: Path | None,
     overrides: list[str],
     *,
@@ -133,21 +138,14 @@ def build_hydra_command(
     trial_id: int | None,
 ) -> list[str]:
     """
-    Construct subprocess command invoking owl_hydra_run.py.
+    Construct the Hydra command-line arguments for owl_hydra_run.
     """
-    package_root = Path(__file__).parents[1]  # src/owlroost
-    script = package_root / "hydra" / "owl_hydra_run.py"
-    conf_dir = package_root / "conf"
-
-    if not script.exists():
-        raise RuntimeError(f"Hydra runner not found: {script}") from None
+    conf_dir = Path(__file__).parents[1] / "conf"
 
     if not conf_dir.exists():
         raise RuntimeError(f"Hydra conf directory not found: {conf_dir}") from None
 
-    cmd = [
-        sys.executable,
-        str(script),
+    args = [
         "--multirun",
         f"--config-path={conf_dir}",
         "--config-name=config",
@@ -155,26 +153,76 @@ def build_hydra_command(
 
     # Inject selected case file
     if case_file:
-        cmd.append(f"case.file={case_file}")
+        args.append(f"case.file={case_file}")
 
     # Trial controls
     if trials is not None:
-        cmd.append(f"trial.count={trials}")
+        args.append(f"trial.count={trials}")
 
     if trial_jobs is not None:
-        cmd.append(f"trial.n_jobs={trial_jobs}")
+        args.append(f"trial.n_jobs={trial_jobs}")
 
     if trial_id is not None:
-        cmd.append(f"trial.id={trial_id}")
+        args.append(f"trial.id={trial_id}")
 
     # Run controls (Hydra launcher parallelism)
     if run_jobs is not None:
-        cmd.append(f"launcher.n_jobs={run_jobs}")
+        args.append(f"launcher.n_jobs={run_jobs}")
 
     # Pass-through Hydra overrides verbatim
-    cmd.extend(overrides)
+    args.extend(overrides)
+
+    return args
 
-    return cmd
+
+def build_hydra_command(hydra_args: list[str]) -> list[str]:
+    """
+    Construct subprocess command invoking owl_hydra_run.py.
+    """
+    script = Path(__file__).parents[1] / "hydra" / "owl_hydra_run.py"
+
+    if not script.exists():
+        raise RuntimeError(f"Hydra runner not found: {script}") from None
+
+    return [sys.executable, str(script), *hydra_args]
+
+
+def run_hydra_in_process(hydra_args: list[str]) -> int:
+    """
+    Run the Hydra entrypoint in this interpreter, as if invoked with hydra_args.
+
+    Avoids starting a second Python interpreter. Hydra reports failures by
+    calling sys.exit(), which is translated back into an exit code.
+
+    Hydra also leaves process-wide state behind (its GlobalHydra singleton
+    and a reconfigured root logger); both are restored afterwards so the
+    rest of the CLI process, or a later in-process run, starts clean.
+    """
+    # Deferred: pulls in Hydra, numpy and OWL, which other commands do not need
+    from hydra.core.global_hydra import GlobalHydra
+
+    from owlroost.hydra import owl_hydra_run
+
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    saved_argv = sys.argv
+    sys.argv = [owl_hydra_run.__file__, *hydra_args]
+    try:
+        owl_hydra_run.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        return 1
+    finally:
+        sys.argv = saved_argv
+        GlobalHydra.instance().clear()
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    return 0
 
 
 # ---------------------------------------------------------------------
@@ -254,6 +302,13 @@ def build_run_help(cmd) -> str:
     show_default=False,
     help="Max concurrent Hydra runs (launcher.n_jobs).",
 )
+@click.option(
+    "--subprocess",
+    "--spawn",
+    "use_subprocess",
+    is_flag=True,
+    help="Run Hydra in a separate Python process instead of in-process.",
+)
 @click.pass_context
 def cmd_run(
     ctx: click.Context,
@@ -262,6 +317,7 @@ def cmd_run(
     trial_id: int | None,
     trial_jobs: int | None,
     run_jobs: int | None,
+    use_subprocess: bool,
 ):
     """
     Run an OWL case via Hydra.
@@ -305,8 +361,7 @@ def cmd_run(
     logger.debug("Trial jobs: {}", trial_jobs)
     logger.debug("Run jobs: {}", run_jobs)
 
-    # Build subprocess command
-    cmd = build_hydra_command(
+    hydra_args = build_hydra_args(
         case_file,
         hydra_overrides,
         trials=trials,
@@ -315,21 +370,26 @@ def cmd_run(
         trial_id=trial_id,
     )
 
-    logger.debug("Executing Hydra:")
-    logger.debug("  {}", " ".join(cmd))
-
     # Execute
     start = time.perf_counter()
 
-    try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        elapsed = time.perf_counter() - start
-        logger.info("Hydra failed after {}", format_elapsed(elapsed))
-        raise click.ClickException(f"Hydra run failed (exit {e.returncode})") from None
+    if use_subprocess:
+        cmd = build_hydra_command(hydra_args)
+        logger.debug("Executing Hydra:")
+        logger.debug("  {}", " ".join(cmd))
+        returncode = subprocess.run(cmd).returncode
     else:
-        elapsed = time.perf_counter() - start
-        logger.info("Hydra completed successfully in {}", format_elapsed(elapsed))
+        logger.debug("Executing Hydra in-process:")
+        logger.debug("  {}", " ".join(hydra_args))
+        returncode = run_hydra_in_process(hydra_args)
+
+    elapsed = time.perf_counter() - start
+
+    if returncode:
+        logger.info("Hydra failed after {}", format_elapsed(elapsed))
+        raise click.ClickException(f"Hydra run failed (exit {returncode})")
+
+    logger.info("Hydra completed successfully in {}", format_elapsed(elapsed))
 
 
 cmd_run.get_help = lambda ctx: build_run_help(cmd_run)
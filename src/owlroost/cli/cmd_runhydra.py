@@ -3,9 +3,7 @@
 from pathlib import Path
 
 import click
-from hydra import compose, initialize_config_dir
 from loguru import logger
-from openpyxl import load_workbook
 
 from owlroost.core.override_parser import hydra_overrides_to_dict
 from owlroost.core.owl_runner import run_single_case
@@ -21,6 +19,8 @@ def load_hydra_cfg(overrides=None):
 
     Supports SINGLE-RUN overrides only.
     """
+    from hydra import compose, initialize_config_dir
+
     conf_dir = Path.cwd() / "conf"
 
     if not conf_dir.exists():
@@ -39,18 +39,20 @@ def load_hydra_cfg(overrides=None):
         )
 
 
+SWEEP_FLAGS = frozenset({"-m", "--multirun"})
+
+
 def reject_sweeps(overrides):
     """
     Explicitly reject Hydra multirun / sweep syntax.
     """
-    for tok in overrides:
-        if tok in {"-m", "--multirun"} or "," in tok:
-            raise click.UsageError(
-                "Parameter sweeps are not supported in `owls run`.\n\n"
-                "Use single-value overrides only, e.g.:\n"
-                "  owls run Case.toml -- longevity.jack=85 longevity.jill=90\n\n"
-                "For sweeps, use the Hydra runner."
-            )
+    if any(tok in SWEEP_FLAGS or "," in tok for tok in overrides):
+        raise click.UsageError(
+            "Parameter sweeps are not supported in `owls run`.\n\n"
+            "Use single-value overrides only, e.g.:\n"
+            "  owls run Case.toml -- longevity.jack=85 longevity.jill=90\n\n"
+            "For sweeps, use the Hydra runner."
+        )
 
 
 def insert_text_as_first_sheet(
@@ -61,11 +63,14 @@ def insert_text_as_first_sheet(
     """
     Insert provided text (resolved TOML) as the first worksheet.
     """
+    from openpyxl import load_workbook
+
     wb = load_workbook(xlsx_path)
     ws = wb.create_sheet(title=sheet_name, index=0)
 
-    for row_idx, line in enumerate(text.splitlines(), start=1):
-        ws.cell(row=row_idx, column=1, value=line)
+    # append() writes whole rows without per-cell coordinate lookups
+    for line in text.splitlines():
+        ws.append((line,))
 
     wb.save(xlsx_path)
 
@@ -125,8 +130,10 @@ def cmd_run(ctx, filename: Path):
     # -----------------------------
     reject_sweeps(ctx.args)
     # -----------------------------
-    # Load Hydra configuration
+    # Validate overrides against the Hydra config
     # -----------------------------
+    # The composed config itself is not needed: compose() is run only so
+    # that unknown keys and a missing ./conf fail before the solve.
     load_hydra_cfg(overrides=ctx.args)
 
     # -----------------------------
@@ -1,25 +1,97 @@
+import atexit
+import copy
+import json
+import os
+import pickle
 import tomllib
 from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import click
-import yaml
 from loguru import logger
 
+# Per-user cache for parsed config and case files
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "owlroost"
+
 # ---------------------------------------------------------------------
 # Config discovery utilities (Hydra-free)
 # ---------------------------------------------------------------------
 
+# Parsed YAML config files, persisted across invocations: {path: (mtime_ns, size, data)}
+YAML_CACHE = CACHE_DIR / "yaml_cache.pkl"
+_yaml_cache: dict[str, tuple[int, int, dict]] | None = None
+_yaml_cache_dirty = False
+
+
+def _get_yaml_cache() -> dict[str, tuple[int, int, dict]]:
+    global _yaml_cache
+    if _yaml_cache is None:
+        try:
+            with YAML_CACHE.open("rb") as f:
+                _yaml_cache = pickle.load(f)
+        except Exception:
+            _yaml_cache = {}
+    return _yaml_cache
+
 
 def _load_yaml(path: Path) -> dict:
     """
     Load YAML file safely.
     Returns empty dict if file is missing or empty.
+
+    Parses are cached on disk by (mtime_ns, size), so warm `--help` calls neither parse
+    YAML nor import PyYAML. Callers get a copy and may modify it freely.
     """
-    if not path.exists():
+    global _yaml_cache_dirty
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return {}
-    data = yaml.safe_load(path.read_text())
-    return data or {}
+
+    cache = _get_yaml_cache()
+    key = str(path.resolve())
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return copy.deepcopy(hit[2])
+
+    import yaml  # deferred: only needed on a cache miss
+
+    # libyaml's CSafeLoader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_text(), Loader=loader) or {}
+
+    cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _yaml_cache_dirty = True
+    return copy.deepcopy(data)
+
+
+def _drop_missing(cache: dict) -> dict:
+    """Remove entries whose file no longer exists, so saved caches do not grow forever."""
+    for key in [k for k in cache if not os.path.exists(k)]:
+        del cache[key]
+    return cache
+
+
+@atexit.register
+def save_yaml_cache() -> None:
+    """Write back parsed YAML files, if any were added. Best effort."""
+    global _yaml_cache_dirty
+    if not _yaml_cache_dirty:
+        return
+    try:
+        YAML_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with YAML_CACHE.open("wb") as f:
+            pickle.dump(_drop_missing(_get_yaml_cache()), f, protocol=pickle.HIGHEST_PROTOCOL)
+        _yaml_cache_dirty = False
+    except OSError:
+        pass
+
+
+def read_toml(path: Path) -> dict:
+    """Read a TOML file as UTF-8 text and parse it."""
+    return tomllib.loads(path.read_text(encoding="utf-8"))
 
 
 def find_default_groups(conf_dir: Path) -> list[str]:
@@ -50,36 +122,34 @@ def _extract_leaf_paths(data, prefix="") -> list[str]:
     """
     Recursively extract dotted leaf paths from nested dicts.
     """
-    paths: list[str] = []
-
-    if isinstance(data, dict):
-        for key, value in data.items():
-            full = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                paths.extend(_extract_leaf_paths(value, full))
-            else:
-                paths.append(full)
-
-    return paths
+    return [path for path, _ in extract_leaf_paths_with_values(data, prefix)]
 
 
 def extract_leaf_paths_with_values(data, prefix=""):
     """
     Recursively extract (path, value) pairs from nested dicts.
 
-    Only leaf values are returned.
+    Only leaf values are returned, in depth-first document order. Traversal
+    uses an explicit stack of item iterators rather than recursion.
     """
     results: list[tuple[str, object]] = []
 
-    if isinstance(data, dict):
-        for key, value in data.items():
+    if not isinstance(data, dict):
+        return results
+
+    stack = [(prefix, iter(data.items()))]
+    while stack:
+        base, items = stack[-1]
+        for key, value in items:
             # key may contain spaces – that is fine
-            full_key = f"{prefix}.{key}" if prefix else key
+            full_key = f"{base}.{key}" if base else key
 
             if isinstance(value, dict):
-                results.extend(extract_leaf_paths_with_values(value, full_key))
-            else:
-                results.append((full_key, value))
+                stack.append((full_key, iter(value.items())))
+                break
+            results.append((full_key, value))
+        else:
+            stack.pop()
 
     return results
 
@@ -178,33 +248,30 @@ def format_override_help(
     if not overrides:
         return ""
 
-    lines = ["\nExamples of possible overrides:\n"]
-    for group, paths in overrides.items():
-        for path, value in paths:
-            lines.append(f"  {group}.{path}={value}")
-
-    return "\n".join(lines) + "\n"
+    body = "\n".join(
+        f"  {group}.{path}={value}" for group, items in overrides.items() for path, value in items
+    )
+    return "\nExamples of possible overrides:\n\n" + body + "\n"
 
 
 def format_click_options(cmd: click.Command) -> str:
     """
     Format Click options for inclusion in custom help output.
     """
-    lines = []
-    for param in cmd.params:
-        if not isinstance(param, click.Option):
-            continue
-
-        opts = ", ".join(param.opts)
-        help_text = param.help or ""
+    rows = tuple(
+        (", ".join(param.opts), param.help or "")
+        for param in cmd.params
+        if isinstance(param, click.Option)
+    )
+    return _format_option_rows(rows)
 
-        lines.append(f"  {opts:<15} {help_text}")
 
-    if len(lines) == 0:
+@lru_cache(maxsize=8)
+def _format_option_rows(rows: tuple[tuple[str, str], ...]) -> str:
+    if not rows:
         return ""
 
-    lines.insert(0, "\nOptions:\n")
-    return "\n".join(lines)
+    return "\nOptions:\n\n" + "\n".join(f"  {opts:<15} {help_text}" for opts, help_text in rows)
 
 
 # ---------------------------------------------------------------------
@@ -214,12 +281,28 @@ def format_click_options(cmd: click.Command) -> str:
 
 def find_case_files(directory: Path) -> list[Path]:
     """Return sorted list of .toml case files."""
-    return sorted(directory.glob("*.toml"))
+    # normcase keeps the suffix match case-insensitive where the filesystem is
+    with os.scandir(directory) as it:
+        names = [e.name for e in it if os.path.normcase(e.name).endswith(".toml") and e.is_file()]
+    names.sort()
+    return [directory / name for name in names]
+
+
+@dataclass
+class CaseIndex:
+    """Case files by stable integer ID and by filename."""
 
+    by_id: dict[int, Path] = field(default_factory=dict)
+    by_name: dict[str, Path] = field(default_factory=dict)
 
-def index_case_files(files: list[Path]) -> list[tuple[int, Path]]:
+
+def index_case_files(files: list[Path]) -> CaseIndex:
     """Assign stable integer IDs to case files."""
-    return list(enumerate(files))
+    index = CaseIndex()
+    for i, f in enumerate(files):
+        index.by_id[i] = f
+        index.by_name.setdefault(f.name, f)
+    return index
 
 
 # ---------------------------------------------------------------------
@@ -229,7 +312,7 @@ def index_case_files(files: list[Path]) -> list[tuple[int, Path]]:
 
 def resolve_case_selector(
     selector: str,
-    indexed_files: list[tuple[int, Path]],
+    indexed_files: CaseIndex,
 ) -> Path | None:
     """
     Resolve a selector into a case Path.
@@ -241,18 +324,14 @@ def resolve_case_selector(
     """
     # Integer ID
     if selector.isdigit():
-        idx = int(selector)
-        return next((f for i, f in indexed_files if i == idx), None)
+        return indexed_files.by_id.get(int(selector))
 
     # Filename or stem
     path = Path(selector)
     if not path.suffix:
         path = path.with_suffix(".toml")
 
-    return next(
-        (f for _, f in indexed_files if f.name == path.name),
-        None,
-    )
+    return indexed_files.by_name.get(path.name)
 
 
 # ---------------------------------------------------------------------
@@ -260,15 +339,68 @@ def resolve_case_selector(
 # ---------------------------------------------------------------------
 
 
+# Parsed case files, persisted across invocations: {path: [mtime_ns, size, data]}
+CASE_META_CACHE = CACHE_DIR / "case_meta.json"
+_case_meta_cache: dict[str, list] | None = None
+_case_meta_dirty = False
+
+
+def _get_case_meta_cache() -> dict[str, list]:
+    global _case_meta_cache
+    if _case_meta_cache is None:
+        try:
+            _case_meta_cache = json.loads(CASE_META_CACHE.read_bytes())
+        except (OSError, ValueError):
+            _case_meta_cache = {}
+    return _case_meta_cache
+
+
+def save_case_metadata_cache() -> None:
+    """Write back parsed case files, if any were added. Best effort."""
+    global _case_meta_dirty
+    if not _case_meta_dirty:
+        return
+    try:
+        CASE_META_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CASE_META_CACHE.write_text(json.dumps(_drop_missing(_get_case_meta_cache())))
+        _case_meta_dirty = False
+    except OSError:
+        pass
+
+
 def load_case_metadata(path: Path) -> dict:
-    """Load TOML safely; return empty dict on failure."""
+    """
+    Load TOML safely; return empty dict on failure.
+
+    Results are cached by (mtime_ns, size); call save_case_metadata_cache()
+    to persist newly parsed files for later invocations. Callers get a copy
+    and may modify it freely.
+    """
+    global _case_meta_dirty
     try:
-        with path.open("rb") as f:
-            return tomllib.load(f)
+        st = path.stat()
+        key = str(path.resolve())
+        cache = _get_case_meta_cache()
+
+        hit = cache.get(key)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return copy.deepcopy(hit[2])
+
+        data = read_toml(path)
     except Exception as e:
         logger.warning(f"Failed to load {path}: {e}")
         return {}
 
+    # TOML dates/times have no JSON form; such files are simply re-parsed
+    try:
+        json.dumps(data)
+    except TypeError:
+        return data
+
+    cache[key] = [st.st_mtime_ns, st.st_size, data]
+    _case_meta_dirty = True
+    return copy.deepcopy(data)
+
 
 def format_optimization_summary(data: dict) -> str:
     opt_block = data.get("optimization_parameters", {})
@@ -329,7 +461,10 @@ def print_case_list(directory: Path) -> list[Path]:
     w_opt = 32
     w_rates = 30
 
-    click.echo(
+    # Rows are collected and echoed once rather than flushed line by line
+    lines = []
+
+    lines.append(
         f"{'ID':>{w_id}} "
         #        f"{'FILE':<{w_file}} "
         f"{'CASE':<{w_case}} "
@@ -338,9 +473,9 @@ def print_case_list(directory: Path) -> list[Path]:
         f"{'RATES':<{w_rates}}"
     )
 
-    click.echo("-" * (w_id + w_case + w_hfp + w_opt + w_rates + 5))
+    lines.append("-" * (w_id + w_case + w_hfp + w_opt + w_rates + 5))
 
-    for idx, path in indexed:
+    for idx, path in indexed.by_id.items():
         data = load_case_metadata(path)
 
         # Case name
@@ -379,7 +514,7 @@ def print_case_list(directory: Path) -> list[Path]:
         #        if len(rates_display) > w_rates:
         #            rates_display = rates_display[: w_rates - 3] + "..."
 
-        click.echo(
+        lines.append(
             f"{idx:>{w_id}} "
             #            f"{path.stem:<{w_file}} "
             f"{case_name:<{w_case}} "
@@ -388,6 +523,9 @@ def print_case_list(directory: Path) -> list[Path]:
             f"{rates_display:<{w_rates}}"
         )
 
+    click.echo("\n".join(lines))
+
+    save_case_metadata_cache()
     return files
 
 
@@ -400,11 +538,12 @@ def normalize_case_file_overrides(args: Iterable[str]) -> list[str]:
     """
     normalized: list[str] = []
 
+    prefix = "case.file="
+
     for arg in args:
-        if arg.startswith("case.file="):
-            _, value = arg.split("=", 1)
-            filename = Path(value).name
-            normalized.append(f"case.file={filename}")
+        if arg.startswith(prefix):
+            filename = Path(arg[len(prefix) :]).name
+            normalized.append(f"{prefix}{filename}")
         else:
             normalized.append(arg)
 
@@ -1,14 +1,12 @@
 # src/owlroost/core/configure_logging.py
 
 import sys
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from loguru import logger
 
-try:
+if TYPE_CHECKING:
     from omegaconf import DictConfig
-except ImportError:  # pragma: no cover
-    DictConfig = None
 
 CURRENT_LOG_LEVEL: str | None = None  # noqa: F841
 
@@ -23,11 +21,34 @@ LOG_LEVELS = {
 }
 
 
+SHORT_FORMAT = "<level>{level:8}</level> | <level>{message}</level>\n"
+FULL_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level:8}</level> | "
+    "<cyan>{name}</cyan>:"
+    "<cyan>{function}</cyan>:"
+    "<cyan>{line}</cyan> - "
+    "<level>{message}</level>\n"
+)
+
+
+def _full_format(record) -> str:
+    # DEBUG / TRACE mode → always full
+    return FULL_FORMAT
+
+
+def _short_info_format(record) -> str:
+    # INFO or higher → short for INFO/SUCCESS, full otherwise
+    if record["level"].name in {"INFO", "SUCCESS"}:
+        return SHORT_FORMAT
+    return FULL_FORMAT
+
+
 def configure_logging(
     log_level: Union[str, "DictConfig"] | None = "INFO",
-):
+) -> str | None:
     """
-    Configure Loguru logging.
+    Configure Loguru logging and return the level applied (None: unchanged).
 
     Behavior:
       - If configured level >= INFO:
@@ -40,11 +61,14 @@ def configure_logging(
     # ------------------------------------------------------------
     # Extract level from Hydra config if provided
     # ------------------------------------------------------------
-    if DictConfig and isinstance(log_level, DictConfig):
+    # A DictConfig can only exist once omegaconf has been imported (by Hydra);
+    # checking sys.modules keeps omegaconf and PyYAML out of CLI start-up.
+    omegaconf = sys.modules.get("omegaconf")
+    if omegaconf and isinstance(log_level, omegaconf.DictConfig):
         log_level = log_level.get("logging", {}).get("level", "INFO")
 
     if not log_level:
-        return
+        return None
 
     log_level = str(log_level).upper()
 
@@ -57,30 +81,12 @@ def configure_logging(
     logger.remove()
 
     # ------------------------------------------------------------
-    # Format function
+    # Format function (chosen once; the level is fixed per handler)
     # ------------------------------------------------------------
-    def dynamic_format(record):
-        record_level = record["level"].name
-
-        short = "<level>{level:8}</level> | <level>{message}</level>\n"
-        full = (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level:8}</level> | "
-            "<cyan>{name}</cyan>:"
-            "<cyan>{function}</cyan>:"
-            "<cyan>{line}</cyan> - "
-            "<level>{message}</level>\n"
-        )
-
-        # DEBUG / TRACE mode → always full
-        if log_level in {"DEBUG", "TRACE"}:
-            return full
-
-        # INFO or higher → short for INFO/SUCCESS, full otherwise
-        if record_level in {"INFO", "SUCCESS"}:
-            return short
-
-        return full
+    if log_level in {"DEBUG", "TRACE"}:
+        record_format = _full_format
+    else:
+        record_format = _short_info_format
 
     # ------------------------------------------------------------
     # Add stderr handler
@@ -91,10 +97,11 @@ def configure_logging(
     logger.add(
         sys.stderr,
         level=log_level,
-        format=dynamic_format,
+        format=record_format,
         backtrace=(log_level == "TRACE"),
         diagnose=(log_level == "TRACE"),
         enqueue=False,  # IMPORTANT for Hydra multiruns / multiprocessing
     )
 
     logger.debug("Loguru configured (level={})", log_level)
+    return log_level
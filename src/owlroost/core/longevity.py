@@ -35,6 +35,9 @@ Modeling notes:
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from functools import lru_cache
+
 import numpy as np
 
 # ============================================================
@@ -126,8 +129,10 @@ MARRIAGE_MULTIPLIER = 0.97  # ~3% mortality reduction
 #
 # Maximum effects are intentionally capped to remain conservative.
 
+SMOKER_K_MID = 2.2  # multiplier at age 40, start of the linear decline
+
 
-def age_dependent_smoker_multiplier(age: float) -> float:
+def age_dependent_smoker_multiplier(age: float | np.ndarray) -> float | np.ndarray:
     """
     Actuarially reasonable smoker mortality multiplier.
 
@@ -135,14 +140,28 @@ def age_dependent_smoker_multiplier(age: float) -> float:
     - Large excess mortality at middle ages
     - Declining effect at advanced ages
     - Mild residual penalty at very old ages
+
+    Accepts a scalar age or an array of ages (evaluated elementwise).
     """
+    if np.ndim(age) == 0:
+        return _smoker_multiplier(float(age))
+
+    age = np.asarray(age, dtype=np.float64)
+    # Declines linearly from ~2.2 at age 40 to ~1.3 by age 80
+    mid = 1.0 + (SMOKER_K_MID - 1.0) * (80 - age) / 40.0
+    return np.where(age < 40, 2.3, np.where(age <= 80, mid, np.where(age <= 90, 1.3, 1.1)))
+
+
+@lru_cache(maxsize=128)
+def _smoker_multiplier(age: float) -> float:
+    # Scalar path, memoized by exact age: ages are not rounded, since the
+    # 40–80 segment is linear in fractional ages.
     if age < 40:
         return 2.3  # conservative maximum (ALI up to ~2.33)
 
     if 40 <= age <= 80:
         # Declines linearly from ~2.2 at age 40 to ~1.3 by age 80
-        k_mid = 2.2
-        excess = k_mid - 1.0
+        excess = SMOKER_K_MID - 1.0
         factor = (80 - age) / 40.0
         return 1.0 + excess * factor
 
@@ -162,8 +181,38 @@ def survival_function(age: np.ndarray, A: float, B: float, C: float) -> np.ndarr
     Gompertz–Makeham survival function S(x).
 
     S(x) = exp( -A·x - (B/C)·(exp(C·x) − 1) )
+
+    exp(C·x) − 1 is evaluated with expm1, which is exact for small C·x.
     """
-    return np.exp(-A * age - (B / C) * (np.exp(C * age) - 1))
+    return np.exp(-A * age - (B / C) * np.expm1(C * age))
+
+
+@lru_cache(maxsize=64)
+def lifetime_cdf(
+    current_age: float,
+    A: float,
+    B: float,
+    C: float,
+    max_age: int = 120,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (ages, F): the integer-age grid from `current_age` to `max_age`
+    and the lifetime CDF on it, conditional on survival to `current_age`.
+
+    Memoized, since Monte Carlo trials sample the same people repeatedly;
+    the returned arrays are read-only.
+    """
+    ages = np.arange(current_age, max_age + 1, 1.0)
+
+    S = survival_function(ages, A, B, C)
+    S0 = survival_function(current_age, A, B, C)
+    S_cond = S / S0
+
+    F = 1.0 - S_cond
+
+    ages.setflags(write=False)
+    F.setflags(write=False)
+    return ages, F
 
 
 def gm_sample_lifetime(
@@ -181,16 +230,45 @@ def gm_sample_lifetime(
     Sampling is performed on an integer-age grid, consistent with
     annual retirement planning models.
     """
-    ages = np.arange(current_age, max_age + 1, 1.0)
+    ages, F = _lifetime_cdf_lists(current_age, A, B, C, max_age)
 
-    S = survival_function(ages, A, B, C)
-    S0 = survival_function(current_age, A, B, C)
-    S_cond = S / S0
+    # Scalar np.interp on a ~60-point grid is dominated by NumPy call
+    # overhead; bisect on Python lists gives the identical interpolation.
+    u = rng.uniform()
+    j = bisect_right(F, u) - 1
+    if j >= len(F) - 1:
+        return ages[-1]
+    slope = (ages[j + 1] - ages[j]) / (F[j + 1] - F[j])
+    return slope * (u - F[j]) + ages[j]
 
-    F = 1.0 - S_cond
 
-    u = rng.uniform()
-    return float(np.interp(u, F, ages))
+@lru_cache(maxsize=64)
+def _lifetime_cdf_lists(
+    current_age: float, A: float, B: float, C: float, max_age: int
+) -> tuple[list[float], list[float]]:
+    ages, F = lifetime_cdf(current_age, A, B, C, max_age)
+    return ages.tolist(), F.tolist()
+
+
+def gm_sample_lifetimes(
+    rng: np.random.Generator,
+    current_age: float,
+    A: float,
+    B: float,
+    C: float,
+    n: int,
+    max_age: int = 120,
+) -> np.ndarray:
+    """
+    Draw `n` lifetimes at once; see gm_sample_lifetime().
+
+    The CDF is built once and interpolated over a vector of uniforms, so the
+    result equals `n` successive gm_sample_lifetime() calls on the same rng.
+    """
+    ages, F = lifetime_cdf(current_age, A, B, C, max_age)
+
+    u = rng.uniform(size=n)
+    return np.interp(u, F, ages)
 
 
 # ============================================================
@@ -200,11 +278,11 @@ def gm_sample_lifetime(
 
 def adjust_parameters(
     health: str,
-    age: float,
+    age: float | np.ndarray,
     sex: str,
     smoker: bool = False,
     married: bool = False,
-) -> tuple[float, float, float]:
+) -> tuple[float, float, float] | tuple[np.ndarray, np.ndarray, float]:
     """
     Compute mortality-adjusted Gompertz–Makeham parameters (A, B, C).
 
@@ -212,7 +290,29 @@ def adjust_parameters(
       mortality (A, B)
     - Health also applies a small adjustment to mortality acceleration (C)
       so that longevity differences persist at advanced ages
+
+    Accepts a scalar age or an array of ages; for an array, A and B are
+    arrays (age only enters through the smoker multiplier).
     """
+    if np.ndim(age) == 0:
+        return _adjust_parameters(health, age, sex, bool(smoker), bool(married))
+
+    A_adj, B_adj, C_adj = _adjust_parameters(health, 0.0, sex, False, married)
+    if smoker:
+        k = age_dependent_smoker_multiplier(age)
+        return A_adj * k, B_adj * k, C_adj
+    return np.full(np.shape(age), A_adj), np.full(np.shape(age), B_adj), C_adj
+
+
+@lru_cache(maxsize=64)
+def _adjust_parameters(
+    health: str,
+    age: float,
+    sex: str,
+    smoker: bool,
+    married: bool,
+) -> tuple[float, float, float]:
+    # Scalar path, memoized: Monte Carlo trials adjust the same people repeatedly.
 
     if health not in HEALTH_MULTIPLIERS:
         raise ValueError(
@@ -256,12 +356,40 @@ def sample_individual_lifetime(
     sex: str = "female",
     smoker: bool = False,
     married: bool = False,
-) -> float:
+    n: int | None = None,
+) -> float | np.ndarray:
     """
     Sample an individual's age at death.
+
+    With `n`, return an array of `n` independent samples instead.
     """
     A, B, C = adjust_parameters(health, current_age, sex, smoker, married)
-    return gm_sample_lifetime(rng, current_age, A, B, C)
+    if n is None:
+        return gm_sample_lifetime(rng, current_age, A, B, C)
+    return gm_sample_lifetimes(rng, current_age, A, B, C, n)
+
+
+def sample_individual_lifetimes_batch(
+    rng: np.random.Generator,
+    ages: list[float],
+    health: list[str],
+    sex: list[str],
+    smoker: list[bool],
+    married: bool = False,
+) -> np.ndarray:
+    """
+    Sample one age at death for each person of a household.
+
+    All uniforms are drawn in a single RNG call; the result equals calling
+    sample_individual_lifetime() once per person, in order, on the same rng.
+    """
+    u = rng.uniform(size=len(ages))
+    out = np.empty(len(ages))
+    for i, age in enumerate(ages):
+        A, B, C = adjust_parameters(health[i], age, sex[i], smoker[i], married)
+        grid, F = lifetime_cdf(age, A, B, C)
+        out[i] = np.interp(u[i], F, grid)
+    return out
 
 
 def sample_joint_last_survivor(
@@ -275,14 +403,19 @@ def sample_joint_last_survivor(
     smoker1: bool = False,
     smoker2: bool = False,
     married: bool = True,
-) -> tuple[float, float, float]:
+    n: int | None = None,
+) -> tuple[float, float, float] | tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Sample two independent lifetimes and return:
 
         (last_survivor_age, life1_age_at_death, life2_age_at_death)
+
+    With `n`, each element is an array of `n` samples.
     """
-    life1 = sample_individual_lifetime(rng, age1, health1, sex1, smoker1, married)
+    life1 = sample_individual_lifetime(rng, age1, health1, sex1, smoker1, married, n)
 
-    life2 = sample_individual_lifetime(rng, age2, health2, sex2, smoker2, married)
+    life2 = sample_individual_lifetime(rng, age2, health2, sex2, smoker2, married, n)
 
-    return max(life1, life2), life1, life2
+    if n is None:
+        return max(life1, life2), life1, life2
+    return np.maximum(life1, life2), life1, life2
@@ -1,9 +1,55 @@
 import json
+import math
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 
+# orjson is an optional speedup for the per-trial JSON outputs; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def has_nonfinite(obj) -> bool:
+    """Return True if a float anywhere in nested dicts/lists/tuples is NaN or infinite."""
+    if isinstance(obj, float | np.floating):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, list | tuple):
+        return any(has_nonfinite(v) for v in obj)
+    return False
+
+
+def write_json(path, data, *, sort_keys: bool = False, default=None) -> None:
+    """
+    Write data as JSON indented by 2, using orjson when it is installed.
+
+    Both paths write the same values: numpy scalars and datetimes go through
+    default, and data holding NaN/inf is written by stdlib json, since orjson
+    would turn those into null.
+    """
+    if orjson is None or has_nonfinite(data):
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=sort_keys, default=default)
+        return
+
+    def orjson_default(obj):
+        # stdlib json writes float subclasses (np.float64) as floats before default
+        if isinstance(obj, float):
+            return float(obj)
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=option, default=orjson_default))
+
 
 def normalize_timestamp(ts) -> str:
     """
@@ -18,40 +64,84 @@ def normalize_timestamp(ts) -> str:
 
 
 def metrics_from_plan(plan) -> dict:
+    """
+    Return the metrics dict for a solved plan.
+
+    The result is memoized on the plan and reused while its solution arrays
+    are the same objects; a re-solve assigns new arrays and recomputes.
+    Callers must treat the returned dict as read-only.
+    """
+    key = (plan.g_n, plan.gamma_n, plan.b_ijn)
+    cached = getattr(plan, "_metrics_cache", None)
+    if cached is not None and all(a is b for a, b in zip(cached[0], key, strict=True)):
+        return cached[1]
+
+    metrics = _compute_metrics(plan)
+    plan._metrics_cache = (key, metrics)
+    return metrics
+
+
+def _compute_metrics(plan) -> dict:
     start_year = int(plan.year_n[0])
     final_year = int(plan.year_n[-1])
 
+    # Yearly series totalled below: spending, Roth conversions (summed over
+    # individuals), ordinary / capital-gains / NIIT taxes, Medicare premiums.
+    # Stacked so nominal totals take one row-sum and real totals (each year
+    # deflated by gamma_n) one matrix-vector product. Forcing contiguous
+    # float64 keeps every reduction on NumPy's typed loops even if the solver
+    # hands back object-dtype or strided arrays.
+    series_kn = np.array(
+        [
+            plan.g_n,
+            plan.x_in.sum(axis=0),
+            plan.T_n,
+            plan.U_n,
+            plan.J_n,
+            plan.m_n + plan.M_n,
+        ],
+        dtype=np.float64,
+    )
+    nominal_k = series_kn.sum(axis=1).tolist()
+    gamma_n = np.ascontiguousarray(plan.gamma_n, dtype=np.float64)
+    real_k = (series_kn @ np.reciprocal(gamma_n[:-1])).tolist()
+
     # ---- totals: spending ----
-    total_net_spending_nominal = float(np.sum(plan.g_n))
-    total_net_spending_real = float(np.sum(plan.g_n / plan.gamma_n[:-1]))
+    total_net_spending_nominal = nominal_k[0]
+    total_net_spending_real = real_k[0]
 
     # ---- totals: Roth conversions ----
-    total_roth_conversions_nominal = float(np.sum(plan.x_in))
-    total_roth_conversions_real = float(np.sum(np.sum(plan.x_in, axis=0) / plan.gamma_n[:-1]))
+    total_roth_conversions_nominal = nominal_k[1]
+    total_roth_conversions_real = real_k[1]
 
     # ---- totals: taxes ----
-    total_tax_ordinary_nominal = float(np.sum(plan.T_n))
-    total_tax_ordinary_real = float(np.sum(plan.T_n / plan.gamma_n[:-1]))
+    total_tax_ordinary_nominal = nominal_k[2]
+    total_tax_ordinary_real = real_k[2]
 
-    total_tax_capital_nominal = float(np.sum(plan.U_n))
-    total_tax_capital_real = float(np.sum(plan.U_n / plan.gamma_n[:-1]))
+    total_tax_capital_nominal = nominal_k[3]
+    total_tax_capital_real = real_k[3]
 
-    total_tax_niit_nominal = float(np.sum(plan.J_n))
-    total_tax_niit_real = float(np.sum(plan.J_n / plan.gamma_n[:-1]))
+    total_tax_niit_nominal = nominal_k[4]
+    total_tax_niit_real = real_k[4]
 
     # ---- totals: Medicare ----
-    total_medicare_premiums_nominal = float(np.sum(plan.m_n + plan.M_n))
-    total_medicare_premiums_real = float(np.sum((plan.m_n + plan.M_n) / plan.gamma_n[:-1]))
+    total_medicare_premiums_nominal = nominal_k[5]
+    total_medicare_premiums_real = real_k[5]
 
     # ---- totals: estate ----
-    estate = np.sum(plan.b_ijn[:, :, plan.N_n], axis=0)
-    estate[1] *= 1 - plan.nu
+    # Sum final balances over individuals and accounts in one pass, with
+    # tax-deferred accounts (j=1) weighted by the heirs' after-tax share.
+    # einsum takes the strided slice as is; float64 input is not copied.
+    b_ij = np.asarray(plan.b_ijn[:, :, int(plan.N_n)], dtype=np.float64)
+    w_j = np.ones(b_ij.shape[1])
+    w_j[1] = 1 - plan.nu
+    estate = np.einsum("ij,j->", b_ij, w_j)
 
     total_final_bequest_nominal = float(
-        np.sum(estate) - plan.remaining_debt_balance + plan.fixed_assets_bequest_value
+        estate - plan.remaining_debt_balance + plan.fixed_assets_bequest_value
     )
 
-    total_final_bequest_real = float(total_final_bequest_nominal / plan.gamma_n[-1])
+    total_final_bequest_real = float(total_final_bequest_nominal / gamma_n[-1])
 
     net_spending_for_plan_year_0 = plan.g_n[0]
 
@@ -96,7 +186,6 @@ def metrics_from_plan(plan) -> dict:
 def write_metrics_json(plan, metrics_path: Path) -> Path:
     metrics = metrics_from_plan(plan)
 
-    with open(metrics_path, "w") as f:
-        json.dump(metrics, f, indent=2, sort_keys=True)
+    write_json(metrics_path, metrics, sort_keys=True)
 
     return metrics_path
@@ -1,17 +1,27 @@
+import re
+
+# Plain ASCII numbers only: unlike int()/float(), values such as "inf", "nan",
+# "1_000" or " 5" stay strings
+_INT_RE = re.compile(r"[-+]?\d+", re.ASCII)
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?", re.ASCII)
+
+_INDEX_RE = re.compile(r"\d+", re.ASCII)
+_DIGIT_RE = re.compile(r"\d", re.ASCII)
+
+
+def _coerce_value(value: str):
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return value
+
+
 def hydra_overrides_to_dict(overrides: list[str]) -> dict:
     """
     Convert Hydra override strings into a nested dictionary,
     correctly handling indexed paths like longevity.values.0=99
     """
-
-    def coerce_value(value: str):
-        if value.isdigit():
-            return int(value)
-        try:
-            return float(value)
-        except ValueError:
-            return value
-
     result = {}
 
     for item in overrides:
@@ -19,36 +29,47 @@ def hydra_overrides_to_dict(overrides: list[str]) -> dict:
             continue
 
         key, raw_value = item.split("=", 1)
-        value = coerce_value(raw_value)
+        value = _coerce_value(raw_value)
+
+        path = key.split(".")
+        if len(path) < 2:
+            continue
+        if "" in path:
+            raise ValueError(f"Empty key segment in override '{item}'")
 
-        parts = key.split(".")
-        if len(parts) < 2:
+        # Fast path: plain dotted keys (e.g. solver.netSpending) cannot hold
+        # a list index, so nest dictionaries directly.
+        if not _DIGIT_RE.search(key):
+            cur = result
+            for name in path[:-1]:
+                cur = cur.setdefault(name, {})
+            cur[path[-1]] = value
             continue
 
+        # tokenize once: (dict key, None) or (None, list index)
+        parts = [(None, int(name)) if _INDEX_RE.fullmatch(name) else (name, None) for name in path]
+        n = len(parts)
+
         cur = result
 
-        for i, part in enumerate(parts):
-            is_last = i == len(parts) - 1
-            next_part = parts[i + 1] if not is_last else None
+        for i in range(n):
+            name, idx = parts[i]
+            is_last = i == n - 1
 
             # ----------------------------
             # Dictionary key
             # ----------------------------
-            if not part.isdigit():
+            if idx is None:
                 if is_last:
-                    cur[part] = value
+                    cur[name] = value
                 else:
                     # decide container type for next level
-                    if part not in cur:
-                        cur[part] = [] if next_part and next_part.isdigit() else {}
-                    cur = cur[part]
+                    cur = cur.setdefault(name, [] if parts[i + 1][0] is None else {})
 
             # ----------------------------
             # List index
             # ----------------------------
             else:
-                idx = int(part)
-
                 if not isinstance(cur, list):
                     raise RuntimeError(f"Invalid list index at '{key}'")
 
@@ -59,7 +80,7 @@ def hydra_overrides_to_dict(overrides: list[str]) -> dict:
                     cur[idx] = value
                 else:
                     if cur[idx] is None:
-                        cur[idx] = [] if next_part and next_part.isdigit() else {}
+                        cur[idx] = [] if parts[i + 1][0] is None else {}
                     cur = cur[idx]
 
     return result
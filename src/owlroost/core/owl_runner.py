@@ -1,20 +1,19 @@
 # src/owlroost/core/owl_runner.py
 import ast
-import json
-import shutil
+import os
+import tomllib
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 
 import numpy as np
-import owlplanner as owl
-import pandas as pd
 import toml
 from loguru import logger
 
-from owlroost.core.metrics_from_plan import write_metrics_json
+from owlroost.core.metrics_from_plan import write_json, write_metrics_json
 
 # ---------------------------------------------------------------------
 # Result object
@@ -34,87 +33,99 @@ class PlanRunResult:
 # ---------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _literal_eval_or_str(s: str):
+    try:
+        return ast.literal_eval(s)
+    except (ValueError, SyntaxError):
+        return s
+
+
 def coerce_override_value(v):
     if isinstance(v, str):
         # Hydra escapes spaces as '\ '
-        v = v.replace("\\ ", " ")
+        v = _literal_eval_or_str(v.replace("\\ ", " "))
 
-        try:
-            return ast.literal_eval(v)
-        except (ValueError, SyntaxError):
-            return v
+        # Cached containers are shared between calls; hand out a private copy
+        if isinstance(v, (list | dict | set)):
+            v = deepcopy(v)
 
     return v
 
 
-def apply_generic_overrides(key: str, diconf: dict, value: dict):
-    group = diconf.setdefault(key, {})
-
-    for k, v in value.items():
-        v = coerce_override_value(v)
-        logger.debug("Overrides: {}: {}={}", key, k, v)
-        group[k] = v
-
-
-def apply_basic_info_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("basic_info", diconf, value)
-
-
-def apply_savings_assets_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("savings_assets", diconf, value)
-
-
-def apply_fixed_income_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("fixed_income", diconf, value)
-
-
-def apply_rates_overrides(diconf: dict, value: dict):
-    logger.debug(f"apply rates overrides: {value}")
+def normalize_rates_overrides(value: dict) -> dict:
+    """
+    Expand rates.fromto=[from, to] into the from/to keys OWL expects.
+    """
+    raw = value.get("fromto")
+    if raw is None:
+        return value
 
-    # Defensive copy so we don’t mutate upstream state
+    # Copy so we don’t mutate upstream state
     value = dict(value)
+    del value["fromto"]
+
+    fromto = coerce_override_value(raw)
+    # After coerce_override_value, fromto should be [from, to]
+    if not isinstance(fromto, (list | tuple)) or len(fromto) != 2:
+        raise ValueError(f"Invalid rates.fromto value: {fromto}")
+
+    frm, to = fromto
+    value["from"] = int(frm)
+    value["to"] = int(to)
+    return value
+
+
+# Hydra override group -> case TOML section it updates
+OVERRIDE_SECTIONS = {
+    "basic_info": "basic_info",
+    "savings_assets": "savings_assets",
+    "fixed_income": "fixed_income",
+    "rates": "rates_selection",
+    "asset_allocation": "asset_allocation",
+    "optimization": "optimization_parameters",
+    "solver": "solver_options",
+}
 
-    # --- Handle fromto ------------------------------------
-    raw = value.pop("fromto", None)
-    if raw is not None:
-        fromto = coerce_override_value(raw)
-        # After coerce_override_value, fromto should be [from, to]
-        if not isinstance(fromto, (list | tuple)) or len(fromto) != 2:
-            raise ValueError(f"Invalid rates.fromto value: {fromto}")
+# Groups whose values need reshaping before the section update
+OVERRIDE_NORMALIZERS = {
+    "rates": normalize_rates_overrides,
+}
 
-        frm, to = fromto
-        value["from"] = int(frm)
-        value["to"] = int(to)
+SEMANTIC_OVERRIDE_KEYS = frozenset(OVERRIDE_SECTIONS)
 
-    # --- Pass remaining keys through generic handler ------
-    apply_generic_overrides("rates_selection", diconf, value)
+# ---------------------------------------------------------------------
+# TOML load / override helpers
+# ---------------------------------------------------------------------
 
 
-def apply_asset_allocation_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("asset_allocation", diconf, value)
+def _toml_loads(text: str) -> dict:
+    # stdlib parser; noticeably faster than the pure-Python `toml` package
+    return tomllib.loads(text)
 
 
-def apply_optimization_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("optimization_parameters", diconf, value)
+def _toml_dumps(data: dict) -> str:
+    # tomllib cannot write; keep `toml` so the emitted text is unchanged
+    return toml.dumps(data)
 
 
-def apply_solver_overrides(diconf: dict, value: dict):
-    apply_generic_overrides("solver_options", diconf, value)
+@lru_cache(maxsize=8)
+def _load_case_toml(case_file: str, mtime_ns: int) -> tuple[dict, str]:
+    diconf = _toml_loads(Path(case_file).read_text(encoding="utf-8"))
 
+    return diconf, _toml_dumps(diconf)
 
-OVERRIDE_HANDLERS = {
-    "basic_info": apply_basic_info_overrides,
-    "savings_assets": apply_savings_assets_overrides,
-    "fixed_income": apply_fixed_income_overrides,
-    "rates": apply_rates_overrides,
-    "asset_allocation": apply_asset_allocation_overrides,
-    "optimization": apply_optimization_overrides,
-    "solver": apply_solver_overrides,
-}
 
-# ---------------------------------------------------------------------
-# TOML load / override helpers
-# ---------------------------------------------------------------------
+def load_case_toml(case_file: str) -> tuple[dict, str]:
+    """
+    Parse a case file once and return (config dict, normalized TOML text).
+
+    Results are cached while the file's mtime is unchanged, so trials of the
+    same case in one worker process share a single parse. The dict is shared:
+    callers must not modify it (load_and_override_toml works on a copy).
+    """
+    case_file = str(case_file)
+    return _load_case_toml(case_file, os.stat(case_file).st_mtime_ns)
 
 
 def load_original_toml(case_file: str) -> str:
@@ -122,22 +133,22 @@ def load_original_toml(case_file: str) -> str:
     Load and normalize the original TOML with no overrides applied.
     Returns normalized TOML text.
     """
-    with open(case_file, encoding="utf-8") as f:
-        diconf = toml.load(f)
-
-    return toml.dumps(diconf)
+    return load_case_toml(case_file)[1]
 
 
-def load_and_override_toml(case_file: str, overrides: dict) -> tuple[StringIO, str, dict]:
-    with open(case_file, encoding="utf-8") as f:
-        diconf = toml.load(f)
+def load_and_override_toml(diconf: dict, overrides: dict) -> dict:
+    """
+    Return a copy of the parsed case config with semantic overrides applied.
 
-    diconf = deepcopy(diconf)
+    Only the top level is copied; each overridden section is replaced by an
+    updated copy, so the (cached) input dict is never modified.
+    """
+    diconf = dict(diconf)
 
-    logger.debug(overrides)
+    logger.debug("Overrides: {}", overrides)
 
     # -------------------------------------------------
-    # Apply semantic overrides via handlers
+    # Apply semantic overrides section by section
     # -------------------------------------------------
     if overrides:
         for key, value in overrides.items():
@@ -146,14 +157,21 @@ def load_and_override_toml(case_file: str, overrides: dict) -> tuple[StringIO, s
                 logger.debug("Skipping index override: {}", key)
                 continue
 
-            try:
-                handler = OVERRIDE_HANDLERS[key]
-            except KeyError as e:
+            section = OVERRIDE_SECTIONS.get(key)
+            if section is None:
                 raise RuntimeError(
-                    f"Unknown override '{key}'. " f"Supported overrides: {list(OVERRIDE_HANDLERS)}"
-                ) from e
+                    f"Unknown override '{key}'. Supported overrides: {list(OVERRIDE_SECTIONS)}"
+                )
+
+            normalize = OVERRIDE_NORMALIZERS.get(key)
+            if normalize is not None:
+                value = normalize(value)
 
-            handler(diconf, value)
+            group = diconf[section] = dict(diconf.get(section, {}))
+            for k, v in value.items():
+                v = coerce_override_value(v)
+                logger.debug("Overrides: {}: {}={}", section, k, v)
+                group[k] = v
 
     return diconf
 
@@ -190,8 +208,22 @@ def normalize_optimization(plan):
 # ---------------------------------------------------------------------
 
 
+# Exact-type fast path for json_safe; subclasses fall through to isinstance.
+_JSON_SAFE_DISPATCH = {
+    type(Path()): str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    np.int64: np.int64.item,
+    np.float64: np.float64.item,
+    np.bool_: np.bool_.item,
+}
+
+
 def json_safe(obj):
     """Convert common non-JSON types to JSON-safe values."""
+    handler = _JSON_SAFE_DISPATCH.get(type(obj))
+    if handler is not None:
+        return handler(obj)
     if isinstance(obj, Path):
         return str(obj)
     if isinstance(obj, (datetime | date)):
@@ -203,72 +235,88 @@ def json_safe(obj):
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
+def output_prefix(output_file: str) -> str:
+    """
+    Return output_file without its suffix; sibling outputs append to it.
+    """
+    return str(Path(output_file).with_suffix(""))
+
+
 def save_early_files(output_file: str, effective_toml: str, original_toml: str) -> None:
     """
     Save TOML files early, for inspection in case of errors
     """
 
-    output_path = Path(output_file)
+    prefix = output_prefix(output_file)
 
-    # Save these files before call.  ORIGINAL TOML
-    original_toml_path = output_path.with_suffix("").with_name(output_path.stem + "_original.toml")
-    with open(original_toml_path, "w", encoding="utf-8") as f:
-        f.write(original_toml)
+    # Save these files before the solve: EFFECTIVE and ORIGINAL TOML
+    effective_path = Path(prefix + "_effective.toml")
+    original_path = Path(prefix + "_original.toml")
+
+    # Drop any earlier hardlink first so the two files never share an inode
+    original_path.unlink(missing_ok=True)
+    effective_path.write_text(effective_toml, encoding="utf-8")
+
+    # Without overrides both texts match; hardlink rather than write twice
+    if original_toml == effective_toml:
+        try:
+            os.link(effective_path, original_path)
+            return
+        except OSError:
+            pass
+
+    original_path.write_text(original_toml, encoding="utf-8")
 
-    # Safe before solve. EFFECTIVE TOML
-    effective_toml_path = output_path.with_suffix("").with_name(
-        output_path.stem + "_effective.toml"
-    )
-    with open(effective_toml_path, "w", encoding="utf-8") as f:
-        f.write(effective_toml)
 
+RATES_COLUMNS = ("S&P 500", "Corporate Baa", "T Bonds", "inflation")
 
-def solve_and_save(plan, output_file: str) -> None:
+
+def write_rates_workbook(plan, rates_path: str) -> None:
+    """
+    Write the yearly rates used for the solve to a one-sheet workbook.
+    Streams rows through a write-only openpyxl workbook (no DataFrame).
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Rates")
+    ws.append(("Year", *RATES_COLUMNS))
+    for row in zip(plan.year_n.tolist(), *plan.tau_kn[: len(RATES_COLUMNS)].tolist(), strict=True):
+        ws.append(row)
+    wb.save(rates_path)
+
+
+def solve_and_save(plan, output_file: str) -> dict | None:
     """
     Solve the plan and write output.
+    Returns the plan summary if the solve succeeded, else None.
     """
     normalize_optimization(plan)
 
-    output_path = Path(output_file)
+    prefix = output_prefix(output_file)
 
     # save rates
-    rates_dict = {
-        "Year": plan.year_n.tolist(),
-        "S&P 500": plan.tau_kn[0].tolist(),
-        "Corporate Baa": plan.tau_kn[1].tolist(),
-        "T Bonds": plan.tau_kn[2].tolist(),
-        "inflation": plan.tau_kn[3].tolist(),
-    }
-    rates_path = output_path.with_suffix("").with_name(output_path.stem + "_rates.xlsx")
-
-    df = pd.DataFrame(rates_dict)
-    df.to_excel(
-        rates_path,
-        index=False,  # no extra index column
-        sheet_name="Rates",  # optional but nice
-    )
+    write_rates_workbook(plan, prefix + "_rates.xlsx")
 
     # solve
     plan.solve(plan.objective, plan.solverOptions)
 
     if plan.caseStatus != "solved":
-        return
+        return None
 
     # Save these files if solve was OK.
 
-    p = Path(output_file)
-    results_file = p.with_name(f"{p.stem}_results{p.suffix}")
-
+    results_file = prefix + "_results" + Path(output_file).suffix
     plan.saveWorkbook(basename=results_file, overwrite=True)
 
     # METRICS
-    metrics_path = output_path.with_suffix("").with_name(output_path.stem + "_metrics.json")
-    write_metrics_json(plan, metrics_path)
+    write_metrics_json(plan, Path(prefix + "_metrics.json"))
 
     # SUMMARY
-    summary_path = output_path.with_suffix("").with_name(output_path.stem + "_summary.json")
-    with open(summary_path, "w") as f:
-        json.dump(plan.summaryDic(), f, indent=2, sort_keys=False, default=json_safe)
+    summary = plan.summaryDic()
+    write_json(prefix + "_summary.json", summary, default=json_safe)
+
+    return summary
 
 
 # ---------------------------------------------------------------------
@@ -289,20 +337,22 @@ def run_single_case(
     ensuring all derived horizons and constraints
     are built correctly by OWL.
     """
-    logger.debug(overrides)
+    # Imported here so processes that only dispatch trials (the Hydra
+    # driver, CLI commands) never pay for owlplanner and its solver stack.
+    import owlplanner as owl
+
+    logger.debug("Overrides: {}", overrides)
 
     # -------------------------------------------------
-    # Load original TOML
+    # Load original TOML (parsed once, shared with overrides below)
     # -------------------------------------------------
-    original_toml = load_original_toml(case_file)
-
-    SEMANTIC_OVERRIDE_KEYS = set(OVERRIDE_HANDLERS)
+    diconf, original_toml = load_case_toml(case_file)
 
     semantic_overrides = (
         {k: v for k, v in overrides.items() if k in SEMANTIC_OVERRIDE_KEYS} if overrides else None
     )
 
-    toml_dict = load_and_override_toml(case_file, semantic_overrides)
+    toml_dict = load_and_override_toml(diconf, semantic_overrides)
 
     hfp_section = toml_dict.get("household_financial_profile", {})
     hfp_file = hfp_section.get("HFP_file_name")
@@ -312,24 +362,35 @@ def run_single_case(
     if hfp_file:
         hfp_path = Path(case_file).parent / hfp_file
 
+        # Read the workbook once and write both copies. Real copies, not
+        # hardlinks, so editing the effective file leaves the original intact.
+        hfp_bytes = hfp_path.read_bytes()
+
         hfp_original = trial_path / f"{hfp_path.stem}_original{hfp_path.suffix}"
-        shutil.copy2(hfp_path, hfp_original)
+        hfp_original.write_bytes(hfp_bytes)
 
         hfp_modified = trial_path / f"{hfp_path.stem}_effective{hfp_path.suffix}"
-        shutil.copy2(hfp_original, hfp_modified)
-        hfp_section["HFP_file_name"] = hfp_modified.name
+        hfp_modified.write_bytes(hfp_bytes)
+        toml_dict["household_financial_profile"] = {
+            **hfp_section,
+            "HFP_file_name": hfp_modified.name,
+        }
 
         # Add code to modify hfp_modified as necessary
 
-    modified_toml = toml.dumps(toml_dict)
-    toml_buf = StringIO(modified_toml)
-    toml_buf.seek(0)
+    # readConfig only takes a path or a text/binary stream, not a dict, and
+    # the effective TOML text is saved alongside the results anyway. With
+    # nothing overridden it is the cached normalized original.
+    if semantic_overrides or hfp_file:
+        modified_toml = _toml_dumps(toml_dict)
+    else:
+        modified_toml = original_toml
 
     save_early_files(output_file, modified_toml, original_toml)
 
     logger.debug("Loading TOML config")
     plan = owl.readConfig(
-        toml_buf,
+        StringIO(modified_toml),
         logstreams="loguru",
         readContributions=False,
     )
@@ -338,7 +399,7 @@ def run_single_case(
         plan.readContributions(str(hfp_modified))
 
     logger.debug("Calling solve_and_save")
-    solve_and_save(plan, output_file)
+    summary = solve_and_save(plan, output_file)
 
     status_file = Path(trial_path) / plan.caseStatus.upper()
     status_file.touch(exist_ok=True)
@@ -349,6 +410,6 @@ def run_single_case(
     return PlanRunResult(
         status="solved",
         output_file=output_file,
-        summary=plan.summaryDic,
+        summary=summary,
         adjusted_toml=modified_toml,
     )
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, distribution, version
 from typing import NamedTuple
 
 
+# Immutable (a tuple of str/None), so the cached instance is safe to share
 class OwlSolverInfo(NamedTuple):
     version: str
     commit: str | None
 
 
+@lru_cache(maxsize=8)
 def _get_vcs_commit(dist_name: str) -> str | None:
     """
     Extract exact VCS commit hash from PEP 610 direct_url.json metadata.
@@ -32,9 +35,12 @@ def _get_vcs_commit(dist_name: str) -> str | None:
         return None
 
 
+@lru_cache(maxsize=1)
 def get_owl_solver_info() -> OwlSolverInfo:
     """
     Return OWL solver version and exact git commit hash (if available).
+
+    Cached: installed package metadata does not change within a process.
     """
     try:
         owl_version = version("owlplanner")
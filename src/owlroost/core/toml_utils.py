@@ -1,7 +1,8 @@
+import os
+import tomllib
+from functools import lru_cache
 from pathlib import Path
 
-import toml
-
 
 def toml_plan_name(path: str) -> str:
     """
@@ -13,15 +14,24 @@ def toml_plan_name(path: str) -> str:
     """
     p = Path(path)
 
-    if not p.exists():
-        raise FileNotFoundError(f"TOML file not found: {p}")
+    try:
+        mtime_ns = os.stat(p).st_mtime_ns
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"TOML file not found: {p}") from e
+
+    return _toml_plan_name(str(p.absolute()), mtime_ns)
+
 
-    data = toml.load(p)
+@lru_cache(maxsize=16)
+def _toml_plan_name(path: str, mtime_ns: int) -> str:
+    # Keyed on (absolute path, mtime) so an edited case file is re-read
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
 
     try:
         name = data["case_name"]
     except KeyError as e:
-        raise KeyError(f"'Case Name' not found in section of {p}") from e
+        raise KeyError(f"'Case Name' not found in section of {path}") from e
 
     # Normalize for filesystem safety
     return name.strip().replace(" ", "_").replace("&", "and")
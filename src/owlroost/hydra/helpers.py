@@ -118,11 +118,8 @@ def register_resolvers():
     """
     Register all OmegaConf resolvers used by OWL-ROOST.
     """
-    OmegaConf.register_new_resolver(
-        "toml.plan_name",
-        toml_plan_name,
-        use_cache=True,  # prevents re-reading TOML repeatedly
-    )
+    # toml_plan_name keeps its own process-wide cache, shared across Hydra jobs
+    OmegaConf.register_new_resolver("toml.plan_name", toml_plan_name)
 
 
 def run_trial(
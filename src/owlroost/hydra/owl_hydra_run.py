@@ -1,7 +1,7 @@
 # src/owlroost/hydra/owl_hydra_run.py
 
-import time
-from multiprocessing import Pool
+import atexit
+from multiprocessing.pool import Pool
 
 import hydra
 import numpy as np
@@ -24,7 +24,7 @@ from owlroost.hydra.helpers import (
     resolve_case_file,
     save_hydra_metadata,
 )
-from owlroost.hydra.trial_worker import run_trial
+from owlroost.hydra.trial_worker import run_trial, run_trial_star
 
 # ---------------------------------------------------------------------
 # Bootstrap (must run before Hydra initializes)
@@ -33,8 +33,81 @@ bootstrap_logging()
 register_resolvers()
 
 
-def fits_uint32(n: int) -> bool:
-    return 0 <= n <= 0xFFFFFFFF
+# ---------------------------------------------------------------------
+# Trial worker pool (shared by all Hydra jobs run in this process)
+# ---------------------------------------------------------------------
+# Workers are recycled after this many trials to bound memory growth
+TRIAL_WORKER_MAX_TASKS = 64
+
+# Forked workers keep the process state (logging included) from the moment
+# the pool was created. Only jobs with the same pool key may share it; all
+# other per-job inputs must travel in the trial arguments.
+_trial_pool: Pool | None = None
+_trial_pool_key: tuple[int, str | None] | None = None
+
+
+def _init_trial_worker() -> None:
+    # Import the solver stack before the first trial. Under fork this is
+    # already inherited from the parent (see get_trial_pool); under spawn
+    # it is paid once per worker rather than inside a trial.
+    import owlplanner  # noqa: F401
+
+
+def get_trial_pool(n_jobs: int, log_level: str | None) -> Pool:
+    """
+    Return a worker pool with n_jobs processes, reusing the one created by
+    an earlier Hydra job in this process when the size and log level match.
+    Worker start-up (numpy, owlplanner imports) is then paid once per
+    multirun; a job with a different log level gets fresh workers that
+    inherit its logging configuration.
+    """
+    global _trial_pool, _trial_pool_key
+
+    key = (n_jobs, log_level)
+    if _trial_pool is not None and _trial_pool_key != key:
+        shutdown_trial_pool()
+
+    if _trial_pool is None:
+        # owlplanner takes over a second to import; loading it here lets
+        # fork-started workers (including recycled ones) inherit it.
+        import owlplanner  # noqa: F401
+
+        _trial_pool = Pool(
+            processes=n_jobs,
+            initializer=_init_trial_worker,
+            maxtasksperchild=TRIAL_WORKER_MAX_TASKS,
+        )
+        _trial_pool_key = key
+
+    return _trial_pool
+
+
+@atexit.register
+def shutdown_trial_pool() -> None:
+    global _trial_pool, _trial_pool_key
+
+    if _trial_pool is not None:
+        _trial_pool.close()
+        _trial_pool.join()
+    _trial_pool = None
+    _trial_pool_key = None
+
+
+# MASTER seed for all trial seeds
+MASTER_SEED = 12345
+
+
+def trial_seeds(trial_id: int, master_seed: int = MASTER_SEED) -> tuple[int, int]:
+    """
+    Return the (rates, longevity) seeds for one trial.
+
+    Identical to master.spawn(n)[trial_id].spawn(2), but built directly from
+    the spawn key, so any single trial costs O(1) regardless of its id.
+    """
+    rates_ss, longevity_ss = (
+        np.random.SeedSequence(master_seed, spawn_key=(trial_id, k)) for k in range(2)
+    )
+    return int(rates_ss.generate_state(1)[0]), int(longevity_ss.generate_state(1)[0])
 
 
 def _extract_trial_override(overrides: dict, key: str, default: int | None = None):
@@ -59,7 +132,7 @@ def main(cfg: DictConfig):
     case_file = resolve_case_file(cfg.case.file)
 
     # Configure logging per Hydra
-    configure_logging(cfg)
+    log_level = configure_logging(cfg)
 
     # Hydra runtime and overrides
     hc = HydraConfig.get()
@@ -92,10 +165,6 @@ def main(cfg: DictConfig):
 
     use_trial_seeds = trial_id_override is not None or trial_count_override > 1
 
-    # MASTER seed for all trial seeds
-    master_seed = 12345
-    master_ss = np.random.SeedSequence(master_seed)
-
     trial_args = []
 
     # ============================================================
@@ -108,13 +177,7 @@ def main(cfg: DictConfig):
         longevity_seed = None
 
         if use_trial_seeds:
-            # Spawn (tid + 1) sequences since we need index tid
-            seqs = master_ss.spawn(tid + 1)
-            trial_ss = seqs[tid]
-
-            rs, ls = trial_ss.spawn(2)
-            rates_seed = int(rs.generate_state(1)[0])
-            longevity_seed = int(ls.generate_state(1)[0])
+            rates_seed, longevity_seed = trial_seeds(tid)
 
         trial_args.append((job_id, tid, rates_seed, longevity_seed, case_file, overrides, run_dir))
         n_trials = 1
@@ -132,19 +195,13 @@ def main(cfg: DictConfig):
     else:
         n_trials = trial_count_override
 
-        # Spawn all trial seeds at once
-        trial_seqs = master_ss.spawn(n_trials)
-
         for tid in range(n_trials):
-            trial_ss = trial_seqs[tid]
-
-            # spawn two independent seeds: rates + longevity
-            rs, ls = trial_ss.spawn(2)
+            # two independent seeds: rates + longevity
+            rates_seed, longevity_seed = trial_seeds(tid)
 
-            rates_seed = int(rs.generate_state(1)[0])
-            longevity_seed = int(ls.generate_state(1)[0])
-
-            logger.debug(f"Trial {tid:04d} seeds: rates={rates_seed}, longevity={longevity_seed}")
+            logger.debug(
+                "Trial {:04d} seeds: rates={}, longevity={}", tid, rates_seed, longevity_seed
+            )
 
             trial_args.append(
                 (job_id, tid, rates_seed, longevity_seed, case_file, overrides, run_dir)
@@ -156,52 +213,33 @@ def main(cfg: DictConfig):
     # Run trials (parallel if needed)
     # -------------------------------------------------------------
 
-    results = []
-    completed = 0
-
-    HEARTBEAT_SEC = 1
-    last_update = time.monotonic()
-
-    def _on_trial_done(result):
-        results.append(result)
-
     if n_trials == 1:
         results = [run_trial(*trial_args[0])]
     else:
-        with Pool(processes=n_jobs) as pool:
-            async_results = [
-                pool.apply_async(run_trial, args, callback=_on_trial_done) for args in trial_args
-            ]
-            async_results = async_results
-
-            with tqdm(
-                total=n_trials,
-                desc=f"{job_id}",
-                unit="trial",
-                dynamic_ncols=True,
-                bar_format="{desc}: {percentage:.1f}% |{bar}| {postfix}",
-                # bar_format="{desc}: {percentage}% |{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
-            ) as pbar:
-                while completed < n_trials:
-                    newly_completed = len(results) - completed
-
-                    if newly_completed:
-                        completed += newly_completed
-                        pbar.update(newly_completed)
-
-                    # Heartbeat (continuous s/trial)
-                    now = time.monotonic()
-                    if now - last_update >= HEARTBEAT_SEC:
-                        elapsed = pbar.format_dict["elapsed"] or 0.0
-                        spt = elapsed / max(completed, 1)
-
-                        pbar.set_postfix_str(
-                            f"elapsed={elapsed:.1f}s, running={completed}/{n_trials}, s_per_trial={spt:.1f}s"
-                        )
-                        pbar.refresh()
-                        last_update = now
-
-                    time.sleep(0.2)
+        results = []
+
+        pool = get_trial_pool(n_jobs, log_level)
+
+        with tqdm(
+            total=n_trials,
+            desc=f"{job_id}",
+            unit="trial",
+            dynamic_ncols=True,
+            bar_format="{desc}: {percentage:.1f}% |{bar}| {postfix}",
+            # bar_format="{desc}: {percentage}% |{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
+        ) as pbar:
+            # Blocks until the next trial finishes; no polling
+            for result in pool.imap_unordered(run_trial_star, trial_args):
+                results.append(result)
+                completed = len(results)
+
+                elapsed = pbar.format_dict["elapsed"] or 0.0
+                spt = elapsed / completed
+                pbar.set_postfix_str(
+                    f"elapsed={elapsed:.1f}s, running={completed}/{n_trials}, s_per_trial={spt:.1f}s",
+                    refresh=False,
+                )
+                pbar.update(1)
 
     # -------------------------------------------------------------
     # Summary
@@ -1,14 +1,13 @@
 # src/owlroost/hydra/trial_worker.py
 
-import tomllib
 from pathlib import Path
 
 import numpy as np
 from loguru import logger
 
 from owlroost.core.configure_logging import CURRENT_LOG_LEVEL
-from owlroost.core.longevity import sample_individual_lifetime
-from owlroost.core.owl_runner import run_single_case
+from owlroost.core.longevity import sample_individual_lifetimes_batch
+from owlroost.core.owl_runner import load_case_toml, run_single_case
 
 
 def run_trial_star(args):
@@ -38,7 +37,8 @@ def run_trial(
 
     # ---------------- longevity ----------------
     if longevity_seed is not None:
-        case_data = tomllib.loads(case_file.read_text())
+        # Same cached parse that run_single_case uses below
+        case_data, _ = load_case_toml(case_file)
 
         ages = case_data["basic_info"]["life_expectancy"]
         health = case_data["basic_info"].get("health", ["average"] * len(ages))
@@ -47,19 +47,11 @@ def run_trial(
         married = case_data["basic_info"].get("married", True)
 
         rng = np.random.default_rng(longevity_seed)
-        life_exp = [
-            int(
-                sample_individual_lifetime(
-                    rng,
-                    current_age=ages[i],
-                    health=health[i],
-                    sex=sex[i],
-                    smoker=smoker[i],
-                    married=married,
-                )
-            )
-            for i in range(len(ages))
-        ]
+        life_exp = (
+            sample_individual_lifetimes_batch(rng, ages, health, sex, smoker, married)
+            .astype(int)
+            .tolist()
+        )
 
         overrides.setdefault("basic_info", {})["life_expectancy"] = life_exp
         overrides["basic_info"]["longevity_seed"] = longevity_seed
@@ -0,0 +1,328 @@
+import json
+import math
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from owlroost.cli import cmd_results
+from owlroost.cli.cmd_results import (
+    discover_cases,
+    discover_cases_cached,
+    extract_run_overrides,
+    load_case_original_toml,
+    normalize_overrides_for_display,
+    parse_id_list,
+)
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _make_trial(trial_dir, net, beq):
+    trial_dir.mkdir(parents=True)
+    (trial_dir / "Case_x_original.toml").write_text(
+        'case_name = "x"\n[optimization_parameters]\nobjective = "maxSpending"\n'
+    )
+    (trial_dir / "Case_x_metrics.json").write_text(
+        json.dumps(
+            {
+                "net_spending_for_plan_year_0": net,
+                "total_net_spending_real": net * 30,
+                "total_final_bequest_real": beq,
+            }
+        )
+    )
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    root = tmp_path / "results"
+
+    # case "alpha": one multirun experiment with two runs, two trials each
+    time_dir = root / "alpha" / "2026-01-01" / "10-00-00"
+    time_dir.mkdir(parents=True)
+    (time_dir / "multirun.yaml").write_text("")
+    for r in range(2):
+        run_dir = time_dir / f"run_{r}"
+        run_dir.mkdir()
+        (run_dir / "hydra_meta.yaml").write_text(
+            "overrides:\n- case.file=Case_x.toml\n- solver.netSpending=9\\ 0\n"
+        )
+        for t in range(2):
+            _make_trial(run_dir / "trials" / f"{t:04d}", 100 + t, 1000 * (r + 1))
+
+    # case "beta": single run without a trials/ directory
+    run_dir = root / "beta" / "2026-01-02" / "11-00-00" / "run_0"
+    _make_trial(run_dir, 50, 500)
+
+    return root
+
+
+# ============================================================
+# Discovery
+# ============================================================
+
+
+def test_discover_cases_structure(results_dir):
+    cases = discover_cases(results_dir)
+
+    assert [c.name for c in cases] == ["alpha", "beta"]
+
+    alpha, beta = cases
+    assert len(alpha.experiments) == 1
+    assert alpha.experiments[0].type == "multi"
+    assert [r.name for r in alpha.experiments[0].runs] == ["run_0", "run_1"]
+    assert [t.name for t in alpha.experiments[0].runs[0].trials] == ["0000", "0001"]
+    assert alpha.experiments[0].runs[0].overrides == ["netSpending=9\\ 0"]
+
+    assert beta.experiments[0].type == "single"
+    (run,) = beta.experiments[0].runs
+    assert [t.path for t in run.trials] == [run.path]
+
+
+def test_discover_cases_serial_matches_threaded(results_dir, monkeypatch):
+    threaded = discover_cases(results_dir)
+    monkeypatch.setattr(cmd_results, "DISCOVERY_THREADS", 1)
+    assert discover_cases(results_dir) == threaded
+
+
+# ============================================================
+# Rendering (via CLI)
+# ============================================================
+
+
+def _invoke(results_dir, monkeypatch, *args):
+    monkeypatch.chdir(results_dir.parent)
+    result = CliRunner().invoke(cmd_results.cmd_results, list(args))
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_results_case_summary(results_dir, monkeypatch):
+    out = _invoke(results_dir, monkeypatch)
+
+    assert "CASE SUMMARY" in out
+    assert "alpha" in out
+    assert "beta" in out
+    assert "maxSpending" in out
+
+
+def test_results_run_summary(results_dir, monkeypatch):
+    out = _invoke(results_dir, monkeypatch, "alpha")
+
+    assert "RUN SUMMARY" in out
+    assert "run_0" in out
+    assert "run_1" in out
+    assert "netSpending=9 0" in out
+    assert "$3K" in out  # averaged net spending (100+101)/2 * 30
+
+
+def test_results_trial_detail(results_dir, monkeypatch):
+    out = _invoke(results_dir, monkeypatch, "alpha", "1", "1", "--metrics")
+
+    assert "TRIAL SUMMARY" in out
+    assert '"net_spending_for_plan_year_0": 101' in out
+
+
+def test_results_trial_detail_loads_each_metrics_file_once(results_dir, monkeypatch):
+    calls = []
+    load_metrics = cmd_results.load_metrics
+
+    def counting_load_metrics(path):
+        calls.append(path)
+        return load_metrics(path)
+
+    monkeypatch.setattr(cmd_results, "load_metrics", counting_load_metrics)
+    _invoke(results_dir, monkeypatch, "alpha", "1", "1", "--metrics")
+
+    assert len(calls) == len(set(calls)) == 2
+
+
+def test_normalize_overrides_for_display():
+    assert normalize_overrides_for_display([]) == "—"
+    assert normalize_overrides_for_display(["count=5"]) == "—"
+    assert (
+        normalize_overrides_for_display(["count=5", "method=historical\\ average", 3, "countx=1"])
+        == "method=historical average, countx=1"
+    )
+
+
+def test_hydra_meta_json_sidecar(results_dir):
+    meta = results_dir / "alpha" / "2026-01-01" / "10-00-00" / "run_0" / "hydra_meta.yaml"
+    sidecar = cmd_results.results_cache_file(meta, "parsed")
+
+    assert not sidecar.exists()
+    first = extract_run_overrides(meta)
+    assert json.loads(sidecar.read_text())["data"]["overrides"][1] == "solver.netSpending=9\\ 0"
+    assert extract_run_overrides(meta) == first
+    assert not list(meta.parent.glob(".*"))
+
+    # an edited YAML invalidates the sidecar, even with an older mtime
+    mtime = meta.stat().st_mtime_ns
+    meta.write_text("overrides:\n- solver.netSpending=7\n")
+    os.utime(meta, ns=(mtime - 10**9,) * 2)
+    assert extract_run_overrides(meta) == ["netSpending=7"]
+
+
+def test_case_original_toml_json_sidecar(results_dir):
+    case = discover_cases(results_dir)[1]
+    (trial,) = case.experiments[0].runs[0].trials
+    toml_path = trial.path / "Case_x_original.toml"
+
+    data = load_case_original_toml(case)
+    assert data["optimization_parameters"]["objective"] == "maxSpending"
+    cached = json.loads(cmd_results.results_cache_file(toml_path, "parsed").read_text())
+    assert cached["source"] == str(toml_path) and cached["data"] == data
+    assert not list(case.path.glob(".*"))
+
+
+def test_sidecar_not_served_for_a_different_source(results_dir):
+    a = results_dir / "a.toml"
+    b = results_dir / "b.toml"
+    a.write_text("x = 1\n")
+    b.write_text("x = 2\n")
+    os.utime(b, ns=(a.stat().st_mtime_ns,) * 2)
+
+    def parse(path):
+        return cmd_results.tomllib.loads(path.read_text())
+
+    assert cmd_results.load_with_sidecar(a, parse) == {"x": 1}
+    assert cmd_results.load_with_sidecar(b, parse) == {"x": 2}
+
+
+def test_discovery_rebuild_prunes_cache_of_deleted_sources(results_dir):
+    meta = results_dir / "alpha" / "2026-01-01" / "10-00-00" / "run_0" / "hydra_meta.yaml"
+    gone = results_dir / "gone.toml"
+    gone.write_text("x = 1\n")
+    extract_run_overrides(meta)
+    cmd_results.load_with_sidecar(gone, lambda p: cmd_results.tomllib.loads(p.read_text()))
+    stray = cmd_results.RESULTS_CACHE_DIR / "stray.parsed.json"
+    stray.write_text("{}")
+
+    gone.unlink()
+    discover_cases_cached(results_dir)
+
+    assert not stray.exists()
+    assert not cmd_results.results_cache_file(gone, "parsed").exists()
+    assert cmd_results.results_cache_file(meta, "parsed").exists()
+    assert cmd_results.results_cache_file(results_dir, "discovery").exists()
+    for f in cmd_results.RESULTS_CACHE_DIR.iterdir():
+        assert os.path.exists(json.loads(f.read_text())["source"])
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    orjson = pytest.importorskip("orjson") if request.param == "orjson" else None
+    monkeypatch.setattr(cmd_results, "orjson", orjson)
+    return request.param
+
+
+def test_json_helpers_match_across_backends(json_backend):
+    data = {"case": "Café", "years": 30, "values": [1, 2.5, None, True]}
+    text = cmd_results.dumps_json_pretty(data)
+
+    assert text == json.dumps(data, indent=2, ensure_ascii=False)
+    assert cmd_results.loads_json(text.encode()) == data
+
+
+def test_json_helpers_keep_nonfinite_floats(json_backend):
+    text = cmd_results.dumps_json_pretty({"x": math.nan, "y": [-math.inf]})
+    assert text == '{\n  "x": NaN,\n  "y": [\n    -Infinity\n  ]\n}'
+
+    data = cmd_results.loads_json(b'{"x": NaN, "y": [-Infinity]}')
+    assert math.isnan(data["x"]) and data["y"] == [-math.inf]
+
+
+def test_parse_id_list_keeps_order_and_dedups():
+    assert parse_id_list("3") == [3]
+    assert parse_id_list("5, 1-3, 2") == [5, 1, 2, 3]
+
+
+def test_discovery_cache_reused_until_tree_changes(results_dir, monkeypatch):
+    first = discover_cases_cached(results_dir)
+    assert cmd_results.results_cache_file(results_dir, "discovery").exists()
+    assert not list(results_dir.glob(".*"))
+    assert first == discover_cases(results_dir)
+
+    monkeypatch.setattr(cmd_results, "discover_cases", lambda _: pytest.fail("cache not used"))
+    assert discover_cases_cached(results_dir) == first
+    monkeypatch.undo()
+
+    # a new trial changes the trials/ directory mtime
+    trials = results_dir / "alpha" / "2026-01-01" / "10-00-00" / "run_1" / "trials"
+    _make_trial(trials / "0002", 1, 1)
+    os.utime(trials, ns=(trials.stat().st_mtime_ns + 10**9,) * 2)
+    runs = discover_cases_cached(results_dir)[0].experiments[0].runs
+    assert [t.name for t in runs[1].trials] == ["0000", "0001", "0002"]
+
+    # a beta run that gains a trials/ directory is picked up too
+    beta_run = results_dir / "beta" / "2026-01-02" / "11-00-00" / "run_0"
+    _make_trial(beta_run / "trials" / "0000", 1, 1)
+    (beta_run,) = discover_cases_cached(results_dir)[1].experiments[0].runs
+    assert [t.name for t in beta_run.trials] == ["0000"]
+
+
+def _touch_later(path):
+    os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+
+
+def test_discovery_cache_sees_runs_added_to_empty_time_dir(results_dir):
+    time_dir = results_dir / "gamma" / "2026-01-03" / "12-00-00"
+    time_dir.mkdir(parents=True)
+    assert discover_cases_cached(results_dir)[2].experiments == []
+
+    # Hydra creates run_0 inside the already-existing (and scanned) time dir
+    _make_trial(time_dir / "run_0", 1, 1)
+    _touch_later(time_dir)
+    (exp,) = discover_cases_cached(results_dir)[2].experiments
+    assert [r.name for r in exp.runs] == ["run_0"]
+
+
+def test_discovery_cache_sees_edited_hydra_meta(results_dir):
+    discover_cases_cached(results_dir)
+
+    meta = results_dir / "alpha" / "2026-01-01" / "10-00-00" / "run_0" / "hydra_meta.yaml"
+    meta.write_text("overrides:\n- solver.netSpending=7\n")
+    _touch_later(meta)
+    run = discover_cases_cached(results_dir)[0].experiments[0].runs[0]
+    assert run.overrides == ["netSpending=7"]
+
+
+def test_results_selected_case_walks_only_that_case(results_dir, monkeypatch):
+    walked = []
+    discover_experiments = cmd_results.discover_experiments
+
+    def recording_discover_experiments(case_dir, watch=None):
+        walked.append(case_dir.name)
+        return discover_experiments(case_dir, watch)
+
+    monkeypatch.setattr(cmd_results, "discover_experiments", recording_discover_experiments)
+    out = _invoke(results_dir, monkeypatch, "1")
+
+    assert walked == ["beta"]
+    assert "RUN SUMMARY" in out
+
+
+def test_results_trial_text_files(results_dir, monkeypatch):
+    out = _invoke(results_dir, monkeypatch, "alpha", "0", "0", "--original", "--effective")
+
+    assert 'objective = "maxSpending"' in out
+    assert "(no effective TOML found)" in out
+
+
+def test_results_trial_files(results_dir, monkeypatch):
+    out = _invoke(results_dir, monkeypatch, "beta", "0", "--files")
+
+    assert "INPUT FILES:" in out
+    assert "Case_x_original.toml" in out
+    assert "Case_x_metrics.json" in out
+
+
+def test_results_trial_files_hide_dot_sidecars(results_dir, monkeypatch):
+    run_dir = results_dir / "beta" / "2026-01-02" / "11-00-00" / "run_0"
+    (run_dir / ".hydra_meta.json").write_text("{}")
+    out = _invoke(results_dir, monkeypatch, "beta", "0", "--files")
+
+    assert ".hydra_meta.json" not in out
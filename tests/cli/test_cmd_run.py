@@ -0,0 +1,102 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from owlroost.cli import cmd_run
+from owlroost.cli.cmd_run import (
+    build_hydra_args,
+    build_hydra_command,
+    get_rate_selection_method,
+    normalize_hydra_overrides,
+    run_hydra_in_process,
+)
+
+
+def test_build_hydra_args_and_command():
+    args = build_hydra_args(
+        Path("Case_x.toml"),
+        ["solver.netSpending=90"],
+        trials=10,
+        trial_jobs=None,
+        run_jobs=2,
+        trial_id=None,
+    )
+
+    assert args[0] == "--multirun"
+    assert args[-3:] == ["trial.count=10", "launcher.n_jobs=2", "solver.netSpending=90"]
+    assert "case.file=Case_x.toml" in args
+
+    cmd = build_hydra_command(args)
+    assert cmd[0] == sys.executable
+    assert cmd[1].endswith("owl_hydra_run.py")
+    assert cmd[2:] == args
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            '[rates_selection]\nfrom = 1969\nmethod = "historical average"  # note\n',
+            "historical average",
+        ),
+        (
+            "[basic_info]\nmethod = 'x'\n[rates_selection] # rates\nmethod = 'stochastic'\n",
+            "stochastic",
+        ),
+        ('[rates_selection]\nfrom = 1969\n[solver]\nmethod = "user"\n', None),
+        ('rates_selection = { method = "histochastic" }\n', "histochastic"),
+        ('[rates_selection]\nmethod = "a\\u0062"\n', "ab"),
+    ],
+)
+def test_get_rate_selection_method(tmp_path, text, expected):
+    case = tmp_path / "Case_x.toml"
+    case.write_text(text)
+    assert get_rate_selection_method(case) == expected
+
+
+def test_normalize_hydra_overrides():
+    assert normalize_hydra_overrides(
+        ["--multirun", "a=1", "b=1,2", "c=[1,2]", "d='x,y'", "e,f"]
+    ) == ["--multirun", "a=1", "b=[1,2]", "c=[1,2]", "d='x,y'", "e,f"]
+
+
+def test_run_hydra_in_process_restores_global_state(monkeypatch):
+    pytest.importorskip("owlplanner")
+    from hydra import initialize
+    from hydra.core.global_hydra import GlobalHydra
+
+    from owlroost.hydra import owl_hydra_run
+
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    argv = sys.argv
+
+    def fake_main():
+        # what a Hydra run leaves behind: initialized Hydra, reconfigured root logger
+        initialize(version_base=None)  # not as a context manager: stays initialized
+        root.addHandler(logging.NullHandler())
+        root.setLevel(logging.CRITICAL)
+        assert sys.argv[1:] == ["a=1"]
+        sys.exit(3)
+
+    monkeypatch.setattr(owl_hydra_run, "main", fake_main)
+
+    for _ in range(2):
+        assert run_hydra_in_process(["a=1"]) == 3
+        assert not GlobalHydra.instance().is_initialized()
+        assert root.handlers == handlers and root.level == level
+        assert sys.argv is argv
+
+
+def test_run_rejects_malformed_case_before_launch(tmp_path, monkeypatch):
+    (tmp_path / "Case_x.toml").write_text('[rates_selection]\nmethod = "stochastic"\nbroken = \n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cmd_run, "run_hydra_in_process", lambda args: pytest.fail("launched"))
+
+    result = CliRunner().invoke(cmd_run.cmd_run, ["Case_x", "--trials", "2"])
+
+    assert result.exit_code != 0
+    assert "Failed to read case file" in result.output
@@ -0,0 +1,139 @@
+import json
+import os
+
+import pytest
+
+from owlroost.cli import utils
+from owlroost.cli.utils import load_case_metadata, save_case_metadata_cache
+
+
+@pytest.fixture
+def meta_cache(isolated_user_cache):
+    return isolated_user_cache / "case_meta.json"
+
+
+def test_case_metadata_cache_round_trip(tmp_path, meta_cache, monkeypatch):
+    case = tmp_path / "Case_a.toml"
+    case.write_text('case_name = "a"\n')
+
+    assert load_case_metadata(case) == {"case_name": "a"}
+    save_case_metadata_cache()
+    assert json.loads(meta_cache.read_text())[str(case.resolve())][2] == {"case_name": "a"}
+
+    # a fresh process is served from disk without parsing
+    monkeypatch.setattr(utils, "_case_meta_cache", None)
+    monkeypatch.setattr(utils, "read_toml", lambda p: pytest.fail("parsed again"))
+    assert load_case_metadata(case) == {"case_name": "a"}
+
+
+def test_case_metadata_cache_invalidated_by_edit(tmp_path, meta_cache):
+    case = tmp_path / "Case_a.toml"
+    case.write_text('case_name = "a"\n')
+    load_case_metadata(case)
+
+    case.write_text('case_name = "bb"\n')
+    os.utime(case, ns=(case.stat().st_mtime_ns + 10**9,) * 2)
+    assert load_case_metadata(case) == {"case_name": "bb"}
+
+
+def test_case_metadata_cache_drops_deleted_files(tmp_path, meta_cache):
+    kept, gone = tmp_path / "Case_a.toml", tmp_path / "Case_b.toml"
+    kept.write_text('case_name = "a"\n')
+    gone.write_text('case_name = "b"\n')
+    load_case_metadata(kept)
+    load_case_metadata(gone)
+    save_case_metadata_cache()
+
+    gone.unlink()
+    (tmp_path / "Case_c.toml").write_text('case_name = "c"\n')
+    load_case_metadata(tmp_path / "Case_c.toml")
+    save_case_metadata_cache()
+
+    saved = json.loads(meta_cache.read_text())
+    assert sorted(saved) == [str(kept.resolve()), str((tmp_path / "Case_c.toml").resolve())]
+
+
+def test_case_metadata_callers_get_copies(tmp_path, meta_cache):
+    case = tmp_path / "Case_a.toml"
+    case.write_text('case_name = "a"\n[basic_info]\nnames = ["Jack"]\n')
+
+    load_case_metadata(case)["basic_info"]["names"].append("Jill")
+    load_case_metadata(case)["case_name"] = "changed"
+
+    assert load_case_metadata(case) == {"case_name": "a", "basic_info": {"names": ["Jack"]}}
+    save_case_metadata_cache()
+    assert json.loads(meta_cache.read_text())[str(case.resolve())][2]["case_name"] == "a"
+
+
+def test_extract_leaf_paths_with_values_keeps_document_order():
+    data = {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4}, "g": {}, "h": 5}
+
+    assert utils.extract_leaf_paths_with_values(data) == [
+        ("a", 1),
+        ("b.c", 2),
+        ("b.d.e", 3),
+        ("b.f", 4),
+        ("h", 5),
+    ]
+    assert utils._extract_leaf_paths(data, "x")[:2] == ["x.a", "x.b.c"]
+
+
+def test_load_yaml_cached_on_disk(tmp_path, isolated_user_cache, monkeypatch):
+    conf = tmp_path / "config.yaml"
+    conf.write_text("defaults:\n- solver: default\n")
+
+    data = utils._load_yaml(conf)
+    assert data == {"defaults": [{"solver": "default"}]}
+    assert not (isolated_user_cache / "yaml_cache.pkl").exists()
+
+    # callers get copies; mutating one leaves the cache intact
+    data["defaults"].clear()
+    assert utils._load_yaml(conf) == {"defaults": [{"solver": "default"}]}
+
+    utils.save_yaml_cache()
+    assert (isolated_user_cache / "yaml_cache.pkl").exists()
+
+    monkeypatch.setattr(utils, "_yaml_cache", None)
+    monkeypatch.setattr("yaml.load", lambda text, Loader: pytest.fail("parsed again"))
+    assert utils.find_default_groups(tmp_path) == ["solver"]
+    monkeypatch.undo()
+
+    assert utils._load_yaml(tmp_path / "missing.yaml") == {}
+
+
+def test_load_yaml_sees_edit_within_same_mtime(tmp_path):
+    conf = tmp_path / "config.yaml"
+    conf.write_text("defaults:\n- solver: default\n")
+    assert utils._load_yaml(conf) == {"defaults": [{"solver": "default"}]}
+
+    st = conf.stat()
+    conf.write_text("defaults:\n- solver: default\n- rates: default\n")
+    os.utime(conf, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert utils._load_yaml(conf) == {"defaults": [{"solver": "default"}, {"rates": "default"}]}
+
+
+def test_resolve_case_selector(tmp_path):
+    files = [tmp_path / "Case_a.toml", tmp_path / "Case_b.toml"]
+    indexed = utils.index_case_files(files)
+
+    assert utils.resolve_case_selector("1", indexed) == files[1]
+    assert utils.resolve_case_selector("Case_a", indexed) == files[0]
+    assert utils.resolve_case_selector("sub/Case_b.toml", indexed) == files[1]
+    assert utils.resolve_case_selector("7", indexed) is None
+    assert utils.resolve_case_selector("Case_c", indexed) is None
+
+
+def test_normalize_case_file_overrides():
+    assert utils.normalize_case_file_overrides(["case.file=/a/b/Case_x.toml", "trial.count=2"]) == [
+        "case.file=Case_x.toml",
+        "trial.count=2",
+    ]
+
+
+def test_find_case_files(tmp_path):
+    for name in ("Case_b.toml", "Case_a.toml", "notes.txt"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "dir.toml").mkdir()
+
+    assert utils.find_case_files(tmp_path) == [tmp_path / "Case_a.toml", tmp_path / "Case_b.toml"]
@@ -0,0 +1,17 @@
+import pytest
+
+from owlroost.cli import cmd_results, utils
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path, monkeypatch):
+    """Keep tests from reading or writing the real ~/.cache/owlroost."""
+    cache_dir = tmp_path / "user-cache"
+    monkeypatch.setattr(utils, "YAML_CACHE", cache_dir / "yaml_cache.pkl")
+    monkeypatch.setattr(utils, "_yaml_cache", None)
+    monkeypatch.setattr(utils, "_yaml_cache_dirty", False)
+    monkeypatch.setattr(utils, "CASE_META_CACHE", cache_dir / "case_meta.json")
+    monkeypatch.setattr(utils, "_case_meta_cache", None)
+    monkeypatch.setattr(utils, "_case_meta_dirty", False)
+    monkeypatch.setattr(cmd_results, "RESULTS_CACHE_DIR", cache_dir / "results")
+    return cache_dir
@@ -6,7 +6,10 @@ from owlroost.core.longevity import (
     SEX_MULTIPLIER,
     adjust_parameters,
     age_dependent_smoker_multiplier,
+    gm_sample_lifetime,
+    lifetime_cdf,
     sample_individual_lifetime,
+    sample_individual_lifetimes_batch,
     sample_joint_last_survivor,
 )
 
@@ -57,6 +60,13 @@ def test_smoker_multiplier_high_at_young_age():
     assert age_dependent_smoker_multiplier(30) > 2.0
 
 
+def test_smoker_multiplier_vectorized_matches_scalar():
+    ages = np.array([20, 39.5, 40, 55.25, 80, 80.5, 90, 95])
+    expected = [age_dependent_smoker_multiplier(float(a)) for a in ages]
+
+    np.testing.assert_allclose(age_dependent_smoker_multiplier(ages), expected)
+
+
 # ============================================================
 # Parameter adjustment sanity checks
 # ============================================================
@@ -78,6 +88,19 @@ def test_adjust_parameters_effect_direction():
     assert B_poor > B_avg
 
 
+@pytest.mark.parametrize("smoker", [False, True])
+def test_adjust_parameters_accepts_array_ages(smoker):
+    ages = np.array([35.0, 52.5, 85.0, 95.0])
+
+    A, B, C = adjust_parameters("poor", ages, "male", smoker, True)
+
+    for i, age in enumerate(ages):
+        a, b, c = adjust_parameters("poor", age, "male", smoker, True)
+        assert A[i] == pytest.approx(a)
+        assert B[i] == pytest.approx(b)
+        assert C == c
+
+
 def test_sex_difference_effect():
     age = 65
 
@@ -123,6 +146,65 @@ def test_smoker_lifetime_shorter_than_non_smoker():
     assert smoker <= non_smoker
 
 
+def test_batch_sampling_matches_repeated_draws():
+    rng = np.random.default_rng(7)
+    batch = sample_individual_lifetime(rng, 60, "average", "male", n=50)
+
+    rng = np.random.default_rng(7)
+    single = [sample_individual_lifetime(rng, 60, "average", "male") for _ in range(50)]
+
+    assert batch.shape == (50,)
+    np.testing.assert_array_equal(batch, single)
+
+
+def test_household_batch_matches_per_person_draws():
+    ages = [62, 67.5, 80]
+    health = ["excellent", "average", "poor"]
+    sex = ["female", "male", "female"]
+    smoker = [False, True, False]
+
+    rng = np.random.default_rng(11)
+    batch = sample_individual_lifetimes_batch(rng, ages, health, sex, smoker, married=True)
+
+    rng = np.random.default_rng(11)
+    single = [
+        sample_individual_lifetime(rng, ages[i], health[i], sex[i], smoker[i], married=True)
+        for i in range(len(ages))
+    ]
+
+    np.testing.assert_array_equal(batch, single)
+
+
+def test_lifetime_cdf_is_cached_and_read_only():
+    A, B, C = adjust_parameters("average", 60, "female")
+    ages, F = lifetime_cdf(60, A, B, C)
+
+    assert lifetime_cdf(60, A, B, C)[1] is F
+    assert F[0] == 0.0 and ages[0] == 60
+    with pytest.raises(ValueError):
+        F[0] = 1.0
+
+
+def test_scalar_sampling_matches_np_interp():
+    A, B, C = adjust_parameters("poor", 70, "male", smoker=True)
+    ages, F = lifetime_cdf(70, A, B, C)
+
+    rng1 = np.random.default_rng(5)
+    rng2 = np.random.default_rng(5)
+    for _ in range(1000):
+        expected = float(np.interp(rng2.uniform(), F, ages))
+        assert gm_sample_lifetime(rng1, 70, A, B, C) == expected
+
+
+def test_joint_last_survivor_batch():
+    rng = np.random.default_rng(123)
+    last, life1, life2 = sample_joint_last_survivor(rng, age1=62, age2=60, n=100)
+
+    np.testing.assert_array_equal(last, np.maximum(life1, life2))
+    assert life1.min() >= 62
+    assert life2.min() >= 60
+
+
 def test_joint_last_survivor():
     rng = np.random.default_rng(123)
 
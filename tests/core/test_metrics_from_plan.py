@@ -0,0 +1,112 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from owlroost.core import metrics_from_plan as mfp
+from owlroost.core.metrics_from_plan import metrics_from_plan, write_metrics_json
+
+
+@pytest.fixture
+def plan():
+    rng = np.random.default_rng(0)
+    n_years = 30
+    return SimpleNamespace(
+        year_n=np.arange(2026, 2026 + n_years),
+        gamma_n=np.cumprod(np.full(n_years + 1, 1.03)),
+        g_n=rng.uniform(50, 100, n_years),
+        x_in=rng.uniform(0, 20, (2, n_years)),
+        T_n=rng.uniform(0, 10, n_years),
+        U_n=rng.uniform(0, 5, n_years),
+        J_n=rng.uniform(0, 1, n_years),
+        m_n=rng.uniform(0, 3, n_years),
+        M_n=rng.uniform(0, 3, n_years),
+        b_ijn=rng.uniform(0, 500, (2, 3, n_years + 1)),
+        N_n=n_years,
+        nu=0.3,
+        remaining_debt_balance=10.0,
+        fixed_assets_bequest_value=50.0,
+        _name="test",
+        _timestamp=datetime(2026, 1, 1),
+        startDate="01-01",
+        A=SimpleNamespace(nvars=100, ncons=50),
+    )
+
+
+def test_real_totals_deflate_each_year(plan):
+    m = metrics_from_plan(plan)
+    gamma = plan.gamma_n[:-1]
+
+    assert m["total_net_spending_real"] == pytest.approx(np.sum(plan.g_n / gamma))
+    assert m["total_roth_conversions_real"] == pytest.approx(
+        np.sum(np.sum(plan.x_in, axis=0) / gamma)
+    )
+    assert m["total_tax_ordinary_real"] == pytest.approx(np.sum(plan.T_n / gamma))
+    assert m["total_tax_capital_real"] == pytest.approx(np.sum(plan.U_n / gamma))
+    assert m["total_tax_niit_real"] == pytest.approx(np.sum(plan.J_n / gamma))
+    assert m["total_medicare_premiums_real"] == pytest.approx(np.sum((plan.m_n + plan.M_n) / gamma))
+    assert m["total_medicare_premiums_nominal"] == pytest.approx(np.sum(plan.m_n + plan.M_n))
+    assert m["total_roth_conversions_nominal"] == pytest.approx(np.sum(plan.x_in))
+    assert type(m["total_tax_niit_nominal"]) is float
+
+
+def test_final_bequest(plan):
+    b_before = plan.b_ijn.copy()
+    m = metrics_from_plan(plan)
+    np.testing.assert_array_equal(plan.b_ijn, b_before)
+
+    estate = np.sum(plan.b_ijn[:, :, plan.N_n], axis=0)
+    estate[1] *= 1 - plan.nu
+    expected = np.sum(estate) - 10.0 + 50.0
+
+    assert m["total_final_bequest_nominal"] == pytest.approx(expected)
+    assert m["total_final_bequest_real"] == pytest.approx(expected / plan.gamma_n[-1])
+
+
+def test_write_metrics_json_sorted(plan, tmp_path):
+    path = write_metrics_json(plan, tmp_path / "m.json")
+    data = json.loads(path.read_text())
+
+    assert list(data) == sorted(data)
+    assert data == pytest.approx(json.loads(json.dumps(metrics_from_plan(plan))))
+
+
+def test_metrics_memoized_until_plan_arrays_change(plan):
+    first = metrics_from_plan(plan)
+    assert metrics_from_plan(plan) is first
+
+    plan.g_n = plan.g_n * 2
+    again = metrics_from_plan(plan)
+    assert again is not first
+    assert again["total_net_spending_nominal"] == pytest.approx(
+        2 * first["total_net_spending_nominal"]
+    )
+
+
+def test_object_dtype_series_are_coerced(plan):
+    expected = metrics_from_plan(plan)
+    plan.g_n = plan.g_n.astype(object)
+    plan.b_ijn = plan.b_ijn.astype(object)
+
+    m = metrics_from_plan(plan)
+    assert m["total_net_spending_real"] == pytest.approx(expected["total_net_spending_real"])
+    assert m["total_final_bequest_real"] == pytest.approx(expected["total_final_bequest_real"])
+    assert type(m["total_net_spending_real"]) is float
+
+
+def test_final_balances_are_read_without_copy(plan, monkeypatch):
+    seen = []
+    einsum = np.einsum
+
+    def recording_einsum(subscripts, *operands):
+        seen.append(operands[0])
+        return einsum(subscripts, *operands)
+
+    monkeypatch.setattr(mfp.np, "einsum", recording_einsum)
+    metrics_from_plan(plan)
+
+    (b_ij,) = seen
+    assert b_ij.shape == (2, 3)
+    assert np.shares_memory(b_ij, plan.b_ijn)
@@ -0,0 +1,73 @@
+import pytest
+
+from owlroost.core.override_parser import hydra_overrides_to_dict
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("7", 7),
+        ("-7", -7),
+        ("2.5", 2.5),
+        (".5", 0.5),
+        ("1e3", 1000.0),
+        ("historical", "historical"),
+        ("[80, 85]", "[80, 85]"),
+        ("1.2.3", "1.2.3"),
+        # float() would accept these; overrides keep them as strings
+        ("inf", "inf"),
+        ("-inf", "-inf"),
+        ("nan", "nan"),
+        ("1_000", "1_000"),
+        (" 5", " 5"),
+        ("1e5 ", "1e5 "),
+    ],
+)
+def test_value_coercion(raw, expected):
+    value = hydra_overrides_to_dict([f"solver.x={raw}"])["solver"]["x"]
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_nested_keys_and_list_indices():
+    out = hydra_overrides_to_dict(
+        [
+            "longevity.values.1=99",
+            "longevity.values.0=88",
+            "solver.netSpending=90",
+            "matrix.0.1=5",
+            "toplevel=1",
+            "no_equals",
+        ]
+    )
+
+    assert out == {
+        "longevity": {"values": [88, 99]},
+        "solver": {"netSpending": 90},
+        "matrix": [[None, 5]],
+    }
+
+
+def test_index_into_dict_is_rejected():
+    with pytest.raises(RuntimeError, match="Invalid list index"):
+        hydra_overrides_to_dict(["solver.a=1", "solver.0=2"])
+
+
+def test_mixed_digit_segments_are_keys():
+    assert hydra_overrides_to_dict(["a.1b.2=3"]) == {"a": {"1b": [None, None, 3]}}
+
+
+def test_flat_and_indexed_keys_share_containers():
+    out = hydra_overrides_to_dict(
+        ["basic_info.names.0=Jack", "basic_info.status=married", "rates.a.b=1"]
+    )
+    assert out == {
+        "basic_info": {"names": ["Jack"], "status": "married"},
+        "rates": {"a": {"b": 1}},
+    }
+
+
+@pytest.mark.parametrize("key", ["a..b", ".a", "a.", "a.0..b", "a..0"])
+def test_empty_key_segment_is_rejected(key):
+    with pytest.raises(ValueError, match="Empty key segment"):
+        hydra_overrides_to_dict([f"{key}=1"])
@@ -0,0 +1,175 @@
+import copy
+import json
+import math
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from openpyxl import load_workbook
+
+pytest.importorskip("owlplanner")
+
+from owlroost.core import metrics_from_plan  # noqa: E402
+from owlroost.core.owl_runner import (  # noqa: E402
+    coerce_override_value,
+    json_safe,
+    load_and_override_toml,
+    output_prefix,
+    save_early_files,
+    write_rates_workbook,
+)
+
+
+@pytest.fixture
+def diconf():
+    return {
+        "case_name": "x",
+        "basic_info": {"names": ["Jack", "Jill"], "life_expectancy": [89, 92]},
+        "optimization_parameters": {"objective": "maxSpending"},
+        "solver_options": {"bequest": 0},
+    }
+
+
+def test_load_and_override_toml_applies_overrides(diconf):
+    out = load_and_override_toml(
+        diconf,
+        {
+            "basic_info": {"life_expectancy": "[80, 85]"},
+            "optimization": {"objective": "maxBequest"},
+            "solver": {"netSpending": "90"},
+        },
+    )
+
+    assert out["basic_info"] == {"names": ["Jack", "Jill"], "life_expectancy": [80, 85]}
+    assert out["optimization_parameters"] == {"objective": "maxBequest"}
+    assert out["solver_options"] == {"bequest": 0, "netSpending": 90}
+
+
+def test_load_and_override_toml_leaves_input_untouched(diconf):
+    before = copy.deepcopy(diconf)
+
+    load_and_override_toml(diconf, {"basic_info": {"life_expectancy": "[80, 85]"}})
+    load_and_override_toml(diconf, {"rates": {"method": "historical", "fromto": "[1969, 2002]"}})
+
+    assert diconf == before
+
+
+def test_output_prefix_matches_sibling_naming(tmp_path):
+    out = tmp_path / "Case_x.v2.xlsx"
+    assert output_prefix(str(out)) + "_metrics.json" == str(
+        out.with_suffix("").with_name(out.stem + "_metrics.json")
+    )
+
+
+def test_load_and_override_toml_rates_fromto(diconf):
+    out = load_and_override_toml(
+        diconf, {"rates": {"method": "historical", "fromto": "[1969, 2002]"}}
+    )
+
+    assert out["rates_selection"] == {"method": "historical", "from": 1969, "to": 2002}
+
+
+def test_load_and_override_toml_rejects_unknown_group(diconf):
+    with pytest.raises(RuntimeError, match="Unknown override 'bogus'"):
+        load_and_override_toml(diconf, {"bogus": {"x": 1}})
+
+
+def test_coerce_override_value_copies_cached_containers():
+    first = coerce_override_value("[80, 85]")
+    first.append(1)
+
+    assert coerce_override_value("[80, 85]") == [80, 85]
+    assert coerce_override_value("historical\\ average") == "historical average"
+    assert coerce_override_value("1.5") == 1.5
+    assert coerce_override_value(7) == 7
+
+
+def test_write_rates_workbook(tmp_path):
+    plan = SimpleNamespace(
+        year_n=np.arange(2026, 2029),
+        tau_kn=np.arange(15, dtype=float).reshape(5, 3),
+    )
+    path = tmp_path / "rates.xlsx"
+    write_rates_workbook(plan, str(path))
+
+    rows = list(load_workbook(path)["Rates"].values)
+    assert rows[0] == ("Year", "S&P 500", "Corporate Baa", "T Bonds", "inflation")
+    assert rows[1:] == [(2026, 0, 3, 6, 9), (2027, 1, 4, 7, 10), (2028, 2, 5, 8, 11)]
+
+
+def test_save_early_files(tmp_path):
+    out = str(tmp_path / "Case_x.xlsx")
+
+    save_early_files(out, "a = 2\n", "a = 1\n")
+    assert (tmp_path / "Case_x_original.toml").read_text() == "a = 1\n"
+    assert (tmp_path / "Case_x_effective.toml").read_text() == "a = 2\n"
+
+    # identical texts: rewritten in place, original shares the effective file
+    save_early_files(out, "a = 3\n", "a = 3\n")
+    assert (tmp_path / "Case_x_original.toml").read_text() == "a = 3\n"
+    assert (tmp_path / "Case_x_effective.toml").read_text() == "a = 3\n"
+
+    # and a later differing write does not leak through the link
+    save_early_files(out, "a = 5\n", "a = 4\n")
+    assert (tmp_path / "Case_x_original.toml").read_text() == "a = 4\n"
+    assert (tmp_path / "Case_x_effective.toml").read_text() == "a = 5\n"
+
+
+def test_json_safe():
+    assert json_safe(Path("a/b")) == "a/b"
+    assert json_safe(datetime(2026, 1, 2, 3, 4)) == "2026-01-02T03:04:00"
+    assert json_safe(date(2026, 1, 2)) == "2026-01-02"
+    assert json_safe(np.int64(3)) == 3 and type(json_safe(np.int64(3))) is int
+    assert json_safe(np.float32(0.5)) == 0.5
+    assert json_safe(np.bool_(True)) is True
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        json_safe(object())
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    orjson = pytest.importorskip("orjson") if request.param == "orjson" else None
+    monkeypatch.setattr(metrics_from_plan, "orjson", orjson)
+    return request.param
+
+
+@pytest.mark.parametrize("nonfinite", [False, True])
+def test_write_json_output_matches_across_backends(tmp_path, json_backend, nonfinite):
+    summary = {
+        "case": Path("cases/Case_x.toml"),
+        "when": datetime(2026, 1, 2, 3, 4),
+        "years": np.int64(30),
+        "rate": np.float32(0.5),
+        "bequest": np.float64(1.25),
+        "solved": np.bool_(True),
+        "nested": {"values": [1, 2.5, None]},
+    }
+    if nonfinite:
+        summary["nested"]["values"].append(float("nan"))
+        summary["upper"] = np.float64("inf")
+    path = tmp_path / "summary.json"
+
+    metrics_from_plan.write_json(path, summary, sort_keys=True, default=json_safe)
+
+    text = path.read_text()
+    data = json.loads(text)
+    assert list(data) == sorted(data)
+    assert data["case"] == "cases/Case_x.toml"
+    assert data["when"] == "2026-01-02T03:04:00"
+    assert data["years"] == 30 and data["rate"] == 0.5 and data["bequest"] == 1.25
+    assert data["solved"] is True
+    assert data["nested"]["values"][:3] == [1, 2.5, None]
+    if nonfinite:
+        assert "NaN" in text and "Infinity" in text
+        assert math.isnan(data["nested"]["values"][3]) and data["upper"] == math.inf
+
+
+def test_write_json_without_default_takes_numpy_floats(tmp_path, json_backend):
+    path = tmp_path / "metrics.json"
+    metrics_from_plan.write_json(path, {"x": np.float64(1.5)})
+    assert json.loads(path.read_text()) == {"x": 1.5}
+
+    with pytest.raises(TypeError):
+        metrics_from_plan.write_json(path, {"x": np.int64(1)})
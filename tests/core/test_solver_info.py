@@ -0,0 +1,24 @@
+import pytest
+
+from owlroost.core import solver_info
+from owlroost.core.solver_info import OwlSolverInfo, get_owl_solver_info
+
+
+def test_get_owl_solver_info_is_cached(monkeypatch):
+    get_owl_solver_info.cache_clear()
+    info = get_owl_solver_info()
+    assert isinstance(info, OwlSolverInfo)
+
+    monkeypatch.setattr(solver_info, "version", lambda _: "changed")
+    assert get_owl_solver_info() is info
+    get_owl_solver_info.cache_clear()
+
+
+def test_cached_solver_info_is_immutable():
+    get_owl_solver_info.cache_clear()
+    info = get_owl_solver_info()
+
+    with pytest.raises(AttributeError):
+        info.version = "x"
+    assert all(v is None or isinstance(v, str) for v in info)
+    get_owl_solver_info.cache_clear()
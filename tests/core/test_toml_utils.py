@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from owlroost.core.toml_utils import toml_plan_name
+
+
+def test_toml_plan_name_normalizes(tmp_path):
+    case = tmp_path / "Case_x.toml"
+    case.write_text('case_name = "Jack & Jill Smith"\n')
+
+    assert toml_plan_name(str(case)) == "Jack_and_Jill_Smith"
+
+
+def test_toml_plan_name_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        toml_plan_name(str(tmp_path / "missing.toml"))
+
+    case = tmp_path / "Case_x.toml"
+    case.write_text("[basic_info]\n")
+    with pytest.raises(KeyError):
+        toml_plan_name(str(case))
+
+
+def test_toml_plan_name_rereads_edited_file(tmp_path):
+    case = tmp_path / "Case_x.toml"
+    case.write_text('case_name = "first"\n')
+    assert toml_plan_name(str(case)) == "first"
+
+    case.write_text('case_name = "second"\n')
+    os.utime(case, ns=(case.stat().st_mtime_ns + 10**9,) * 2)
+    assert toml_plan_name(str(case)) == "second"
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from owlroost.hydra import owl_hydra_run
+from owlroost.hydra.owl_hydra_run import MASTER_SEED, trial_seeds
+
+
+def test_trial_seeds_match_spawned_sequences():
+    spawned = np.random.SeedSequence(MASTER_SEED).spawn(20)
+
+    for tid in (0, 1, 7, 19):
+        rs, ls = spawned[tid].spawn(2)
+        assert trial_seeds(tid) == (int(rs.generate_state(1)[0]), int(ls.generate_state(1)[0]))
+
+
+def test_trial_seeds_are_distinct():
+    seeds = [s for tid in range(50) for s in trial_seeds(tid)]
+    assert len(set(seeds)) == len(seeds)
+
+
+class FakePool:
+    def __init__(self, processes, initializer, maxtasksperchild):
+        self.processes = processes
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def join(self):
+        pass
+
+
+def test_trial_pool_reused_only_for_same_size_and_log_level(monkeypatch):
+    pytest.importorskip("owlplanner")
+    monkeypatch.setattr(owl_hydra_run, "Pool", FakePool)
+    owl_hydra_run.shutdown_trial_pool()
+
+    first = owl_hydra_run.get_trial_pool(2, "INFO")
+    assert owl_hydra_run.get_trial_pool(2, "INFO") is first
+
+    debug = owl_hydra_run.get_trial_pool(2, "DEBUG")
+    assert debug is not first and first.closed
+
+    resized = owl_hydra_run.get_trial_pool(3, "DEBUG")
+    assert resized is not debug and resized.processes == 3
+
+    owl_hydra_run.shutdown_trial_pool()
+    assert owl_hydra_run._trial_pool is None
+    assert owl_hydra_run._trial_pool_key is None
+    assert owl_hydra_run.get_trial_pool(3, "DEBUG") is not resized
+    owl_hydra_run.shutdown_trial_pool()
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("owlplanner")
+
+from owlroost.core import owl_runner  # noqa: E402
+from owlroost.hydra import trial_worker  # noqa: E402
+
+
+@pytest.fixture
+def case_file(tmp_path):
+    path = tmp_path / "Case_x.toml"
+    path.write_text('case_name = "x"\n[basic_info]\nlife_expectancy = [89, 92]\n')
+    return path
+
+
+def test_run_trial_samples_lifetimes_from_cached_parse(case_file, tmp_path, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        trial_worker,
+        "run_single_case",
+        lambda **kw: seen.append(kw["overrides"]) or SimpleNamespace(status="solved"),
+    )
+    owl_runner._load_case_toml.cache_clear()
+
+    for trial_id in range(3):
+        out = trial_worker.run_trial(0, trial_id, 1, 100 + trial_id, case_file, {}, tmp_path)
+        assert out["status"] == "solved"
+
+    assert owl_runner._load_case_toml.cache_info().misses == 1
+    assert [o["basic_info"]["longevity_seed"] for o in seen] == [100, 101, 102]
+    assert all(len(o["basic_info"]["life_expectancy"]) == 2 for o in seen)